@@ -13,16 +13,33 @@ Author: VelocityTrader Team
 Version: 1.0.0
 """
 
+import io
+import os
 import re
 import sys
 import json
+import hashlib
 import argparse
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Dict, List, Optional, TextIO, Tuple
+from itertools import accumulate, islice
 from enum import Enum
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from bisect import bisect_right
+
+try:
+    import hyperscan  # Optional: vectorized multi-pattern prefilter
+except ImportError:
+    hyperscan = None
+
+try:
+    import ahocorasick  # Optional: literal keyword prefilter (pyahocorasick)
+except ImportError:
+    ahocorasick = None
 
 
 class Severity(Enum):
@@ -44,7 +61,7 @@ class Category(Enum):
     DATA_INTEGRITY = "DATA_INTEGRITY"  # Repainting, warmup, buffer issues
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Represents a code issue"""
     file: str
@@ -56,6 +73,40 @@ class Issue:
     suggestion: str = ""
     context: str = ""
 
+    def to_dict(self) -> Dict:
+        return {
+            "file": self.file,
+            "line": self.line,
+            "category": self.category.value,
+            "severity": self.severity.value,
+            "rule": self.rule,
+            "message": self.message,
+            "suggestion": self.suggestion,
+            "context": self.context,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "Issue":
+        # File, rule and message text repeat across issues - intern them so
+        # issues loaded from the cache share one copy, like freshly found ones
+        return cls(
+            file=sys.intern(data["file"]),
+            line=data["line"],
+            category=Category(data["category"]),
+            severity=Severity(data["severity"]),
+            rule=sys.intern(data["rule"]),
+            message=sys.intern(data["message"]),
+            suggestion=sys.intern(data.get("suggestion", "")),
+            context=data.get("context", ""),
+        )
+
+    def intern_strings(self):
+        """Share repeated strings with other issues (e.g. after unpickling)"""
+        self.file = sys.intern(self.file)
+        self.rule = sys.intern(self.rule)
+        self.message = sys.intern(self.message)
+        self.suggestion = sys.intern(self.suggestion)
+
 
 @dataclass
 class AuditResult:
@@ -64,21 +115,66 @@ class AuditResult:
     total_lines: int = 0
     issues: List[Issue] = field(default_factory=list)
     metrics: Dict = field(default_factory=dict)
+    # Running tallies - add issues through add_issue/add_issues to keep them current
+    severity_counts: Counter = field(default_factory=Counter, repr=False)
+    category_counts: Counter = field(default_factory=Counter, repr=False)
 
     def add_issue(self, issue: Issue):
         self.issues.append(issue)
+        self.severity_counts[issue.severity] += 1
+        self.category_counts[issue.category] += 1
+
+    def add_issues(self, issues: List[Issue]):
+        self.issues.extend(issues)
+        self.severity_counts.update(issue.severity for issue in issues)
+        self.category_counts.update(issue.category for issue in issues)
 
     def count_by_severity(self) -> Dict[str, int]:
-        counts = {s.value: 0 for s in Severity}
-        for issue in self.issues:
-            counts[issue.severity.value] += 1
-        return counts
+        return {s.value: self.severity_counts[s] for s in Severity}
 
     def count_by_category(self) -> Dict[str, int]:
-        counts = {c.value: 0 for c in Category}
-        for issue in self.issues:
-            counts[issue.category.value] += 1
-        return counts
+        return {c.value: self.category_counts[c] for c in Category}
+
+
+def _line_bounded(pattern: str) -> str:
+    """Rewrite a single-line regex so it cannot match across a newline.
+
+    The pattern tables are written for one line at a time. To run them over a
+    whole file, the constructs that can consume a newline - \\s, \\W, \\D and
+    negated classes - are narrowed to exclude it.
+    """
+    narrowed = {'s': r'[^\S\n]', 'W': r'[^\w\n]', 'D': r'[^\d\n]'}
+    out = []
+    in_class = class_negated = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if not in_class and escape[1:] in narrowed:
+                out.append(narrowed[escape[1:]])
+            elif in_class and escape[1:] in narrowed and not class_negated:
+                raise ValueError(f"Cannot line-bound {escape} inside a character class: {pattern}")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        if in_class:
+            if char == ']':
+                in_class = False
+            out.append(char)
+        elif char == '[':
+            in_class = True
+            class_negated = pattern.startswith('[^', i)
+            if class_negated:
+                out.append('[^\\n')
+                i += 2
+                continue
+            out.append(char)
+        else:
+            out.append(char)
+        i += 1
+    return ''.join(out)
 
 
 class MQL5SuperAudit:
@@ -381,245 +477,556 @@ class MQL5SuperAudit:
         r'\(int\)\s*dataSize',               # Data size calculations
     ]
 
-    def __init__(self, project_root: Path):
+    # ArrayResize(x, 0) clears an array - never flagged as unchecked
+    ARRAY_CLEAR_PATTERN = re.compile(r'ArrayResize\s*\([^,]+,\s*0\s*\)')
+
+    # Ratio/capture names whose divisions are typically guarded elsewhere
+    RATIO_WORDS = r'[Rr]atio|[Ff]actor|[Pp]ercent|[Cc]aptured'
+
+    # Dangerous financial patterns that need special handling, reported after
+    # the tables above: pattern -> (rule, message, suggestion, severity,
+    # flags, exemption). A line that also matches the exemption is not flagged.
+    DANGEROUS_PATTERNS = {
+        # (int)lots or (int)volume without MathRound
+        r'\(\s*int\s*\)\s*\w*(lot|volume)\w*': (
+            "Unrounded lot cast",
+            "Casting lot/volume to int without rounding - (int)2.99 = 2!",
+            "Use (int)MathRound(lots) or NormalizeLots()",
+            Severity.ERROR, re.IGNORECASE,
+            r'MathRound|MathFloor|MathCeil'
+        ),
+        # Division that could cause divide-by-zero in financial calc
+        r'(profit|loss|pnl|equity|balance|margin)\s*/\s*[a-zA-Z_]\w*': (
+            "Potential division by zero",
+            "Division in financial calculation - ensure divisor != 0",
+            "Add zero check: if(divisor != 0) or use safe division",
+            Severity.WARNING, re.IGNORECASE,
+            r'/\s*\d+\.?\d*'                  # Dividing by constant is safe
+            r'|!=\s*0|>\s*0|<\s*0|if\s*\('    # Has inline check
+            r'|' + RATIO_WORDS                # Ratios are typically guarded
+            + r'|^ {9}'                       # 9+ spaces = inside if block, likely guarded
+        ),
+        # Price comparison without NormalizeDouble
+        r'(price|sl|tp|ask|bid)\s*(==|!=)\s*(price|sl|tp|ask|bid|\d+\.)': (
+            "Direct price comparison",
+            "Comparing prices directly may fail due to floating point",
+            "Use MathAbs(price1 - price2) < _Point or NormalizeDouble",
+            Severity.WARNING, re.IGNORECASE,
+            r'NormalizeDouble|MathAbs.*<'
+        ),
+        # AccountInfoDouble cast to int (balance overflow risk)
+        # Only flag AccountInfoDouble, not AccountInfoInteger (which is safe to cast)
+        r'\(\s*int\s*\)\s*AccountInfoDouble': (
+            "Account value overflow risk",
+            "Casting AccountInfoDouble to int - overflow if balance > 2.1B",
+            "Use double or long for account values",
+            Severity.ERROR, 0,
+            None
+        ),
+        # Hardcoded stop loss/take profit in points
+        r'(sl|tp|stoploss|takeprofit)\s*=\s*\d{2,4}\s*[;,)]': (
+            "Hardcoded SL/TP points",
+            "Hardcoded stop loss/take profit value",
+            "Use input parameter or calculated value based on ATR",
+            Severity.INFO, re.IGNORECASE,
+            None
+        ),
+    }
+
+    # Default per-project result cache, see --no-cache
+    CACHE_FILENAME = ".mql5_audit_cache.json"
+
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 16
+
+    def __init__(self, project_root: Path, cache_path: Optional[Path] = None, jobs: int = 1):
         self.project_root = Path(project_root)
         self.result = AuditResult()
+        self.jobs = max(1, jobs)
+        # Per-file results keyed by relative path: {"hash": ..., "issues": [...]}
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._cache: Dict[str, Dict] = {}
+        self._cache_updates: Dict[str, Dict] = {}
+        # Per-category scan plan, walked once per file by audit_file:
+        # (fused prefilter, compiled patterns, category, anchor keywords)
+        self._scan_plan = tuple(
+            (fused, patterns, category, self._table_keywords(patterns))
+            for fused, patterns, category in (
+                (self._mql4_fused, self._mql4_compiled, Category.MQL4_DEPRECATED),
+                (self._cpp_fused, self._cpp_compiled, Category.CPP_UNSUPPORTED),
+                (self._best_practice_fused, self._best_practice_compiled, Category.BEST_PRACTICE),
+                (self._financial_fused, self._financial_compiled, Category.FINANCIAL_SAFETY),
+                (self._data_integrity_fused, self._data_integrity_compiled, Category.DATA_INTEGRITY),
+                (self._dangerous_fused, self._dangerous_compiled, Category.FINANCIAL_SAFETY),
+            )
+        )
+
+    @classmethod
+    def _compile_patterns(cls):
+        """Compile the pattern tables once at import time.
+
+        Patterns are compiled line-bounded and MULTILINE so audit_file can run
+        each one over the whole file instead of calling it once per line.
+        Everything an Issue needs from its rule - severity, the formatted
+        message and the exemption check - is resolved here too, so matches
+        only copy references.
+        """
+        # Any one safe cast exempts the line, so a single alternation stops
+        # at the first that fires instead of trying each pattern in turn
+        cls._safe_cast_pattern = re.compile("|".join(f"(?:{p})" for p in cls.SAFE_CAST_PATTERNS))
+
+        def compile_table(patterns: Dict[str, tuple], label: str, default_severity: Optional[Severity] = None,
+                          flags: int = 0, exemption=None) -> Tuple[tuple, ...]:
+            table = []
+            for pattern, meta in patterns.items():
+                name, suggestion = meta[0], meta[1]
+                severity = meta[2] if len(meta) > 2 else default_severity
+                table.append((
+                    re.compile(_line_bounded(pattern), flags | re.MULTILINE),
+                    sys.intern(name), severity, sys.intern(f"{label}: {name}"), sys.intern(suggestion),
+                    exemption(name) if exemption else None
+                ))
+            return tuple(table)
+
+        cls._mql4_compiled = compile_table(cls.MQL4_PATTERNS, "Deprecated MQL4 pattern", Severity.ERROR)
+        cls._cpp_compiled = compile_table(cls.CPP_PATTERNS, "Unsupported C++ pattern", Severity.ERROR)
+        # ArrayResize(x, 0) only clears the array - always safe
+        cls._best_practice_compiled = compile_table(
+            cls.BEST_PRACTICE_PATTERNS, "Best practice",
+            exemption=lambda name: cls.ARRAY_CLEAR_PATTERN.search if 'ArrayResize' in name else None
+        )
+        # Lines with a known intentional cast are exempt (see SAFE_CAST_PATTERNS)
+        cls._financial_compiled = compile_table(cls.FINANCIAL_PATTERNS, "Financial safety",
+                                                exemption=lambda name: cls._safe_cast_pattern.search)
+        cls._data_integrity_compiled = compile_table(cls.DATA_INTEGRITY_PATTERNS, "Data integrity",
+                                                     flags=re.IGNORECASE)
+        cls._dangerous_compiled = tuple(
+            (re.compile(_line_bounded(pattern), flags | re.MULTILINE),
+             sys.intern(name), severity, sys.intern(message), sys.intern(suggestion),
+             re.compile(exemption).search if exemption else None)
+            for pattern, (name, message, suggestion, severity, flags, exemption) in cls.DANGEROUS_PATTERNS.items()
+        )
+
+        # One alternation per category, scanned once over each file to find the
+        # lines worth checking. Rules can overlap on a line (e.g. close[0] >
+        # open[0]), so those lines still run the individual patterns.
+        cls._mql4_fused = cls._fuse(cls._mql4_compiled)
+        cls._cpp_fused = cls._fuse(cls._cpp_compiled)
+        cls._best_practice_fused = cls._fuse(cls._best_practice_compiled)
+        cls._financial_fused = cls._fuse(cls._financial_compiled)
+        cls._data_integrity_fused = cls._fuse(cls._data_integrity_compiled)
+        cls._dangerous_fused = cls._fuse(cls._dangerous_compiled)
+
+        cls._hyperscan_db, cls._hyperscan_rules = cls._build_hyperscan_db()
+        cls._keyword_automaton, cls._unanchored_rules = cls._build_keyword_automaton()
+
+        # Cached results are only valid for the exact auditor that produced
+        # them - any edit to this module (rules or checks) invalidates them
+        try:
+            source = Path(__file__).read_bytes()
+        except OSError:
+            source = repr((cls.MQL4_PATTERNS, cls.CPP_PATTERNS, cls.BEST_PRACTICE_PATTERNS,
+                           cls.FINANCIAL_PATTERNS, cls.DATA_INTEGRITY_PATTERNS,
+                           cls.SAFE_CAST_PATTERNS, cls.DANGEROUS_PATTERNS)).encode('utf-8')
+        cls._rules_fingerprint = hashlib.sha256(source).hexdigest()
+
+    @staticmethod
+    def _fuse(rules: Tuple[tuple, ...]) -> re.Pattern:
+        """Combine a compiled pattern table into a single alternation.
+
+        Each branch keeps its own pattern's case sensitivity as a scoped flag.
+        """
+        patterns = [rule[0] for rule in rules]
+        return re.compile("|".join(f"(?{'i' if p.flags & re.IGNORECASE else ''}:{p.pattern})"
+                                   for p in patterns), re.MULTILINE)
+
+    @classmethod
+    def _build_hyperscan_db(cls):
+        """Compile every rule pattern into one hyperscan prefilter database.
+
+        Returns (None, []) when hyperscan is unavailable or rejects a pattern;
+        audit_file then falls back to the fused re prefilters.
+        """
+        if hyperscan is None:
+            return None, []
+
+        tables = (cls._mql4_compiled, cls._cpp_compiled, cls._best_practice_compiled,
+                  cls._financial_compiled, cls._data_integrity_compiled, cls._dangerous_compiled)
+        # PREFILTER approximates constructs hyperscan cannot run exactly
+        # (lookarounds), so hits are a superset - re still finds the matches.
+        base_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_MULTILINE
+                      | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+                      | hyperscan.HS_FLAG_SINGLEMATCH)
+        rules = []
+        expressions, flags = [], []
+        for table in tables:
+            for rule in table:
+                pattern = rule[0]
+                rules.append(pattern)
+                expressions.append(pattern.pattern.encode('utf-8'))
+                flags.append(base_flags | (hyperscan.HS_FLAG_CASELESS if pattern.flags & re.IGNORECASE else 0))
+
+        try:
+            db = hyperscan.Database()
+            db.compile(expressions=expressions, ids=list(range(len(rules))),
+                       elements=len(expressions), flags=flags)
+        except Exception as e:
+            print(f"Warning: hyperscan unavailable, using re prefilter: {e}")
+            return None, []
+        return db, rules
+
+    # Leading keyword(s) of a rule: zero-width anchors, then one identifier or
+    # a group of identifier alternatives that is not optional or repeated
+    _KEYWORD_PREFIX = re.compile(
+        r'(?:' + '|'.join(map(re.escape, (r'\b', r'^[^\S\n]*', r'(?<!\.)', r'(?<!\w)'))) + r')*'
+        r'(?:([A-Za-z_]\w{2,})(?![\w?*{])|\(((?:[A-Za-z_]\w*\|)*[A-Za-z_]\w*)\)(?![?*{]))'
+    )
+
+    @classmethod
+    def _rule_keywords(cls, pattern: re.Pattern) -> Optional[Tuple[str, ...]]:
+        """Literals of which any match of the rule must contain one, if known"""
+        if pattern.flags & re.IGNORECASE:
+            return None
+        source = pattern.pattern
+        # A top-level alternation would make the leading keyword optional
+        depth, index, in_class = 0, 0, False
+        while index < len(source):
+            char = source[index]
+            if char == '\\':
+                index += 1
+            elif in_class:
+                in_class = char != ']'
+            elif char == '[':
+                in_class = True
+            elif char == '(':
+                depth += 1
+            elif char == ')':
+                depth -= 1
+            elif char == '|' and depth == 0:
+                return None
+            index += 1
+        match = cls._KEYWORD_PREFIX.match(source)
+        if match is None:
+            return None
+        return (match.group(1),) if match.group(1) else tuple(match.group(2).split('|'))
+
+    @classmethod
+    def _build_keyword_automaton(cls):
+        """Build one Aho-Corasick automaton over the rules' keyword literals.
+
+        Returns (automaton, rules without keywords), or (None, ()) when
+        pyahocorasick is unavailable. A rule with keywords can only match a
+        file that contains one of them.
+        """
+        if ahocorasick is None:
+            return None, ()
+
+        keywords = defaultdict(set)
+        unanchored = set()
+        for table in (cls._mql4_compiled, cls._cpp_compiled, cls._best_practice_compiled,
+                      cls._financial_compiled, cls._data_integrity_compiled, cls._dangerous_compiled):
+            for rule in table:
+                pattern = rule[0]
+                words = cls._rule_keywords(pattern)
+                if words is None:
+                    unanchored.add(pattern)
+                    continue
+                for word in words:
+                    keywords[word].add(pattern)
+
+        automaton = ahocorasick.Automaton()
+        for word, patterns in keywords.items():
+            automaton.add_word(word, frozenset(patterns))
+        automaton.make_automaton()
+        return automaton, frozenset(unanchored)
+
+    @classmethod
+    def _table_keywords(cls, rules: Tuple[tuple, ...]) -> Optional[Tuple[str, ...]]:
+        """Keywords a file must contain one of for the table to match.
+
+        None if some rule in the table has no keywords.
+        """
+        keywords = []
+        for rule in rules:
+            words = cls._rule_keywords(rule[0])
+            if words is None:
+                return None
+            keywords.extend(word for word in words if word not in keywords)
+        # Short words are the likeliest to occur, ending the search early
+        return tuple(sorted(keywords, key=len))
+
+    def _keyword_hits(self, text: str) -> set:
+        """Scan the whole file once; return the rule patterns that may match it"""
+        hits = set(self._unanchored_rules)
+        for _, patterns in self._keyword_automaton.iter(text):
+            hits.update(patterns)
+        return hits
+
+    def _hyperscan_hits(self, text: str) -> set:
+        """Scan the whole file once; return the rule patterns that may match it"""
+        rules = self._hyperscan_rules
+        hits = set()
+
+        def on_match(rule_index, start, end, flags, context):
+            hits.add(rules[rule_index])
+
+        self._hyperscan_db.scan(text.encode('utf-8'), match_event_handler=on_match)
+        return hits
+
+    # Source extensions collected by find_mql5_files
+    MQL5_EXTENSIONS = ('.mq5', '.mqh')
 
     def find_mql5_files(self) -> List[Path]:
         """Find all MQL5 files in the project"""
         files = []
         mql5_dir = self.project_root / "MQL5"
         try:
-            if mql5_dir.exists():
-                try:
-                    files.extend(mql5_dir.rglob("*.mq5"))
-                except (OSError, PermissionError) as e:
-                    print(f"Warning: Error scanning for .mq5 files: {e}")
-                try:
-                    files.extend(mql5_dir.rglob("*.mqh"))
-                except (OSError, PermissionError) as e:
-                    print(f"Warning: Error scanning for .mqh files: {e}")
+            if not mql5_dir.exists():
+                return []
         except (OSError, PermissionError) as e:
             print(f"Error: Cannot access MQL5 directory '{mql5_dir}': {e}")
             return []
 
+        # One scandir walk collects both extensions; DirEntry answers the
+        # directory check from the listing without another stat
+        pending = [str(mql5_dir)]
+        while pending:
+            directory = pending.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif os.path.normcase(entry.name).endswith(self.MQL5_EXTENSIONS):
+                            files.append(entry.path)
+            except (OSError, PermissionError) as e:
+                print(f"Warning: Error scanning '{directory}': {e}")
+
         try:
-            return sorted(files)
+            return sorted(Path(f) for f in files)
         except (TypeError, OSError) as e:
             print(f"Warning: Error sorting file list: {e}")
-            return list(files)
+            return [Path(f) for f in files]
 
     # Suppression comments - allows developers to mark verified-safe code
     # Usage: // NOAUDIT: reason
     #        // SAFE: warmup handled in OnInit
     SUPPRESSION_PATTERN = re.compile(r'//\s*(NOAUDIT|SAFE|VERIFIED|REVIEWED)\s*:', re.IGNORECASE)
 
-    def audit_file(self, file_path: Path) -> List[Issue]:
-        """Audit a single file"""
-        issues = []
+    # Comment lines or suppressed lines, matched over a whole file at once
+    SKIP_LINE_PATTERN = re.compile(
+        r'^[^\S\n]*//|' + _line_bounded(SUPPRESSION_PATTERN.pattern),
+        re.MULTILINE | re.IGNORECASE
+    )
+
+    # Characters other than "\n" that str.splitlines treats as line breaks
+    OTHER_LINE_BREAKS = re.compile(r'[\v\f\x1c\x1d\x1e\x85\u2028\u2029]')
+
+    def audit_file(self, file_path: Path) -> Tuple[List[Issue], Optional[int]]:
+        """Audit a single file.
+
+        Returns (issues, line count); the line count is None if the file
+        could not be read.
+        """
+        content = self._read_source(file_path)
+        if content is None:
+            return [], None
+
+        # Same newline handling as a text-mode read
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        line_count = content.count('\n') + (1 if content and not content.endswith('\n') else 0)
+        lines = content.splitlines()
 
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                lines = content.splitlines()
+            rel_path = str(file_path.relative_to(self.project_root))
+        except ValueError:
+            # File is not relative to project root
+            rel_path = str(file_path)
+        rel_path = sys.intern(rel_path)
+
+        digest = None
+        if self.cache_path is not None:
+            digest = hashlib.sha256(content.encode('utf-8')).hexdigest()
+            issues = self._cached_issues(rel_path, digest)
+            if issues is not None:
+                return issues, line_count
+
+        text, line_starts = self._scan_text(content, lines)
+        issues = self._match_rules(rel_path, text, lines, line_starts)
+
+        if digest is not None:
+            self._cache_updates[rel_path] = {
+                "hash": digest,
+                "issues": [issue.to_dict() for issue in issues],
+            }
+
+        return issues, line_count
+
+    @staticmethod
+    def _read_source(file_path: Path) -> Optional[str]:
+        """Read and decode a file, or warn and return None if it cannot be read"""
+        try:
+            return file_path.read_bytes().decode('utf-8', errors='ignore')
         except FileNotFoundError:
             print(f"Warning: File not found: {file_path}")
-            return issues
         except PermissionError:
             print(f"Warning: Permission denied reading: {file_path}")
-            return issues
         except (IOError, OSError) as e:
             print(f"Warning: I/O error reading '{file_path}': {e}")
-            return issues
         except Exception as e:
             print(f"Warning: Unexpected error reading '{file_path}': {e}")
-            return issues
+        return None
 
+    def _cached_issues(self, rel_path: str, digest: str) -> Optional[List[Issue]]:
+        """Issues cached for this content hash, or None if the file must be audited"""
+        cached = self._cache.get(rel_path)
+        if cached is None or cached.get("hash") != digest:
+            return None
         try:
-            rel_path = str(file_path.relative_to(self.project_root))
-        except ValueError:
-            # File is not relative to project root
-            rel_path = str(file_path)
-
-        for i, line in enumerate(lines, 1):
-            # Skip comments
-            stripped = line.strip()
-            if stripped.startswith('//'):
-                continue
-
-            # Skip lines with suppression comments (developer verified safe)
-            if self.SUPPRESSION_PATTERN.search(line):
-                continue
+            issues = [Issue.from_dict(d) for d in cached["issues"]]
+        except (KeyError, TypeError, ValueError):
+            return None  # Malformed entry - audit the file again
+        self._cache_updates[rel_path] = cached
+        return issues
 
-            # Check MQL4 deprecated patterns
-            for pattern, (name, suggestion) in self.MQL4_PATTERNS.items():
-                if re.search(pattern, line):
-                    issues.append(Issue(
-                        file=rel_path,
-                        line=i,
-                        category=Category.MQL4_DEPRECATED,
-                        severity=Severity.ERROR,
-                        rule=name,
-                        message=f"Deprecated MQL4 pattern: {name}",
-                        suggestion=suggestion,
-                        context=stripped[:80]
-                    ))
-
-            # Check C++ unsupported patterns
-            for pattern, (name, suggestion) in self.CPP_PATTERNS.items():
-                if re.search(pattern, line):
-                    issues.append(Issue(
-                        file=rel_path,
-                        line=i,
-                        category=Category.CPP_UNSUPPORTED,
-                        severity=Severity.ERROR,
-                        rule=name,
-                        message=f"Unsupported C++ pattern: {name}",
-                        suggestion=suggestion,
-                        context=stripped[:80]
-                    ))
-
-            # Check best practice patterns
-            for pattern, (name, suggestion, severity) in self.BEST_PRACTICE_PATTERNS.items():
-                if re.search(pattern, line):
-                    # Skip ArrayResize(x, 0) - clearing arrays is always safe
-                    if 'ArrayResize' in name and re.search(r'ArrayResize\s*\([^,]+,\s*0\s*\)', line):
+    def _scan_text(self, content: str, lines: List[str]) -> Tuple[str, List[int]]:
+        """Build the text the rules run over and the offset each line starts at"""
+        # Scan the whole file once per pattern rather than once per line.
+        # Lines are re-joined with "\n" so every line break is a single
+        # character that the line-bounded patterns never match across.
+        # Usually that is just the decoded content without its final newline,
+        # so the content is reused instead of building a second copy.
+        if self.OTHER_LINE_BREAKS.search(content) is None:
+            text = content[:-1] if content.endswith('\n') else content
+        else:
+            text = "\n".join(lines)
+        line_starts = [0]
+        line_starts.extend(accumulate(len(line) + 1 for line in lines))
+
+        # Comment lines and lines carrying a suppression comment are skipped.
+        # They are blanked so the regex engine never walks them.
+        skipped = {bisect_right(line_starts, match.start()) - 1
+                   for match in self.SKIP_LINE_PATTERN.finditer(text)}
+        if skipped:
+            scanned = ["" if index in skipped else line for index, line in enumerate(lines)]
+            text = "\n".join(scanned)
+            line_starts = [0]
+            line_starts.extend(accumulate(len(line) + 1 for line in scanned))
+        return text, line_starts
+
+    def _prefilter_hits(self, text: str):
+        """Rules that may match somewhere in text, or None without a prefilter"""
+        if self._hyperscan_db is not None:
+            return self._hyperscan_hits(text)
+        if self._keyword_automaton is not None:
+            return self._keyword_hits(text)
+        return None
+
+    def _match_rules(self, rel_path: str, text: str, lines: List[str], line_starts: List[int]) -> List[Issue]:
+        """Run the scan plan over text, returning issues in line order"""
+        hits = self._prefilter_hits(text)
+
+        # Issues per 0-based line index, kept in plan order within each line
+        found = defaultdict(list)
+        contexts = {}
+        # Globals used for every match, bound once per file
+        make_issue = Issue
+        line_of = bisect_right
+        for fused, patterns, category, keywords in self._scan_plan:
+            if hits is not None:
+                rules = [rule for rule in patterns if rule[0] in hits]
+                if not rules:
+                    continue
+            elif keywords is not None and not any(word in text for word in keywords):
+                continue  # No rule in the table can match this file
+            else:
+                rules = patterns
+            # One pass of the category alternation finds every line on which
+            # some rule matches - matches are line-bounded, so finditer cannot
+            # step over such a line. Only those lines run the individual rules.
+            last_index = -1
+            for match in fused.finditer(text):
+                index = line_of(line_starts, match.start()) - 1
+                if index == last_index:
+                    continue
+                last_index = index
+                line = lines[index]
+                context = None
+                for pattern, name, severity, message, suggestion, is_exempt in rules:
+                    if not pattern.search(line):
                         continue
-                    issues.append(Issue(
-                        file=rel_path,
-                        line=i,
-                        category=Category.BEST_PRACTICE,
-                        severity=severity,
-                        rule=name,
-                        message=f"Best practice: {name}",
-                        suggestion=suggestion,
-                        context=stripped[:80]
-                    ))
-
-            # Check financial safety patterns
-            for pattern, (name, suggestion, severity) in self.FINANCIAL_PATTERNS.items():
-                if re.search(pattern, line):
-                    # Skip if it matches a known safe pattern
-                    is_safe = False
-                    for safe_pattern in self.SAFE_CAST_PATTERNS:
-                        if re.search(safe_pattern, line):
-                            is_safe = True
-                            break
-                    if not is_safe:
-                        issues.append(Issue(
-                            file=rel_path,
-                            line=i,
-                            category=Category.FINANCIAL_SAFETY,
-                            severity=severity,
-                            rule=name,
-                            message=f"Financial safety: {name}",
-                            suggestion=suggestion,
-                            context=stripped[:80]
-                        ))
-
-            # Check data integrity patterns (repainting, warmup, off-by-one, buffers)
-            for pattern, (name, suggestion, severity) in self.DATA_INTEGRITY_PATTERNS.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    issues.append(Issue(
-                        file=rel_path,
-                        line=i,
-                        category=Category.DATA_INTEGRITY,
-                        severity=severity,
-                        rule=name,
-                        message=f"Data integrity: {name}",
-                        suggestion=suggestion,
-                        context=stripped[:80]
-                    ))
-
-            # Check for additional dangerous patterns not covered above
-            self._check_dangerous_patterns(line, stripped, rel_path, i, issues)
+                    if is_exempt is not None and is_exempt(line):
+                        continue
+                    if context is None:
+                        context = contexts.get(index)
+                        if context is None:
+                            context = contexts[index] = line.strip()[:80]
+                    found[index].append(make_issue(rel_path, index + 1, category, severity,
+                                                   name, message, suggestion, context))
 
+        issues = []
+        for index in sorted(found):
+            issues.extend(found[index])
         return issues
 
-    def _check_dangerous_patterns(self, line: str, stripped: str, rel_path: str, line_num: int, issues: List[Issue]):
-        """Check for dangerous financial patterns that need special handling"""
-
-        # Pattern: (int)lots or (int)volume without MathRound
-        if re.search(r'\(\s*int\s*\)\s*\w*(lot|volume)\w*', line, re.IGNORECASE):
-            if not re.search(r'MathRound|MathFloor|MathCeil', line):
-                issues.append(Issue(
-                    file=rel_path,
-                    line=line_num,
-                    category=Category.FINANCIAL_SAFETY,
-                    severity=Severity.ERROR,
-                    rule="Unrounded lot cast",
-                    message="Casting lot/volume to int without rounding - (int)2.99 = 2!",
-                    suggestion="Use (int)MathRound(lots) or NormalizeLots()",
-                    context=stripped[:80]
-                ))
-
-        # Pattern: Division that could cause divide-by-zero in financial calc
-        # Skip if: dividing by constant, has zero check on same line, is a ratio, or is indented (likely guarded)
-        if re.search(r'(profit|loss|pnl|equity|balance|margin)\s*/\s*[a-zA-Z_]\w*', line, re.IGNORECASE):
-            # Skip if dividing by constant number
-            if re.search(r'/\s*\d+\.?\d*', line):
-                pass  # Dividing by constant is safe
-            # Skip if there's a zero check on the same line
-            elif re.search(r'(!=\s*0|>\s*0|<\s*0|if\s*\()', line):
-                pass  # Has inline check
-            # Skip common ratio/capture patterns that are guarded elsewhere
-            elif re.search(r'Ratio|ratio|Factor|factor|Percent|percent|captured|Captured', line):
-                pass  # Ratios are typically guarded
-            # Skip if deeply indented (likely inside a guarded block)
-            elif line.startswith('         '):  # 9+ spaces = inside if block
-                pass  # Likely has guard in outer scope
-            else:
-                issues.append(Issue(
-                    file=rel_path,
-                    line=line_num,
-                    category=Category.FINANCIAL_SAFETY,
-                    severity=Severity.WARNING,
-                    rule="Potential division by zero",
-                    message="Division in financial calculation - ensure divisor != 0",
-                    suggestion="Add zero check: if(divisor != 0) or use safe division",
-                    context=stripped[:80]
-                ))
+    def _audit_file_safe(self, file_path: Path) -> Tuple[List[Issue], Optional[int]]:
+        """audit_file that reports failures instead of raising"""
+        try:
+            return self.audit_file(file_path)
+        except Exception as e:
+            print(f"Warning: Error auditing '{file_path}': {e}")
+            return [], 0
 
-        # Pattern: Price comparison without NormalizeDouble
-        if re.search(r'(price|sl|tp|ask|bid)\s*(==|!=)\s*(price|sl|tp|ask|bid|\d+\.)', line, re.IGNORECASE):
-            if not re.search(r'NormalizeDouble|MathAbs.*<', line):
-                issues.append(Issue(
-                    file=rel_path,
-                    line=line_num,
-                    category=Category.FINANCIAL_SAFETY,
-                    severity=Severity.WARNING,
-                    rule="Direct price comparison",
-                    message="Comparing prices directly may fail due to floating point",
-                    suggestion="Use MathAbs(price1 - price2) < _Point or NormalizeDouble",
-                    context=stripped[:80]
-                ))
+    def _audit_files(self, files: List[Path]) -> List[Tuple[List[Issue], Optional[int]]]:
+        """Audit files in order, fanning out to worker processes for large runs"""
+        if self.jobs <= 1 or len(files) < self.PARALLEL_MIN_FILES:
+            return [self._audit_file_safe(file_path) for file_path in files]
 
-        # Pattern: AccountInfoDouble cast to int (balance overflow risk)
-        # Only flag AccountInfoDouble, not AccountInfoInteger (which is safe to cast)
-        if re.search(r'\(\s*int\s*\)\s*AccountInfoDouble', line):
-            issues.append(Issue(
-                file=rel_path,
-                line=line_num,
-                category=Category.FINANCIAL_SAFETY,
-                severity=Severity.ERROR,
-                rule="Account value overflow risk",
-                message="Casting AccountInfoDouble to int - overflow if balance > 2.1B",
-                suggestion="Use double or long for account values",
-                context=stripped[:80]
-            ))
-
-        # Pattern: Hardcoded stop loss/take profit in points
-        if re.search(r'(sl|tp|stoploss|takeprofit)\s*=\s*\d{2,4}\s*[;,)]', line, re.IGNORECASE):
-            issues.append(Issue(
-                file=rel_path,
-                line=line_num,
-                category=Category.FINANCIAL_SAFETY,
-                severity=Severity.INFO,
-                rule="Hardcoded SL/TP points",
-                message="Hardcoded stop loss/take profit value",
-                suggestion="Use input parameter or calculated value based on ATR",
-                context=stripped[:80]
-            ))
+        chunksize = max(1, len(files) // (self.jobs * 4))
+        results = []
+        try:
+            with ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker,
+                                     initargs=(self.project_root, self.cache_path, self._cache)) as executor:
+                for result, cache_updates in executor.map(_audit_file_worker, files, chunksize=chunksize):
+                    # Unpickled issues carry private copies of every string
+                    for issue in result[0]:
+                        issue.intern_strings()
+                    results.append(result)
+                    self._cache_updates.update(cache_updates)
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel audit unavailable, continuing serially: {e}")
+            return [self._audit_file_safe(file_path) for file_path in files]
+        return results
+
+    def _load_cache(self):
+        """Load cached per-file results, starting empty if missing or stale"""
+        self._cache = {}
+        self._cache_updates = {}
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        except (IOError, OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable audit cache '{self.cache_path}': {e}")
+            return
+
+        if (isinstance(data, dict) and data.get("version") == self._rules_fingerprint
+                and isinstance(data.get("files"), dict)):
+            self._cache = data["files"]
+
+    def _save_cache(self):
+        """Persist results for the files audited in this run"""
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self._rules_fingerprint, "files": self._cache_updates}, f)
+        except (IOError, OSError) as e:
+            print(f"Warning: Could not write audit cache '{self.cache_path}': {e}")
 
     def run_audit(self) -> AuditResult:
         """Run complete audit"""
@@ -629,36 +1036,21 @@ class MQL5SuperAudit:
         if not files:
             print("Warning: No MQL5 files found to audit")
 
+        self._load_cache()
         total_lines = 0
         files_with_errors = 0
-        for file_path in files:
-            try:
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    total_lines += len(lines)
-            except FileNotFoundError:
-                files_with_errors += 1
-                print(f"Warning: File disappeared during audit: {file_path}")
-                continue
-            except PermissionError:
+        for issues, line_count in self._audit_files(files):
+            if line_count is None:
                 files_with_errors += 1
-                print(f"Warning: Permission denied: {file_path}")
                 continue
-            except (IOError, OSError) as e:
-                files_with_errors += 1
-                print(f"Warning: I/O error reading '{file_path}': {e}")
-                continue
-
-            try:
-                issues = self.audit_file(file_path)
-                for issue in issues:
-                    self.result.add_issue(issue)
-            except Exception as e:
-                print(f"Warning: Error auditing '{file_path}': {e}")
+            total_lines += line_count
+            self.result.add_issues(issues)
 
         if files_with_errors > 0:
             print(f"Warning: {files_with_errors} file(s) could not be read")
 
+        self._save_cache()
+
         self.result.total_lines = total_lines
         self.result.metrics = {
             "files_scanned": self.result.total_files,
@@ -688,9 +1080,10 @@ class MQL5SuperAudit:
         print()
 
         # By severity
+        severity_counts = self.result.count_by_severity()
         print("BY SEVERITY")
         print("-" * 40)
-        for severity, count in self.result.count_by_severity().items():
+        for severity, count in severity_counts.items():
             if count > 0:
                 print(f"  {severity}: {count}")
         print()
@@ -703,37 +1096,39 @@ class MQL5SuperAudit:
                 print(f"  {category}: {count}")
         print()
 
-        # Critical/Error issues
-        critical_errors = [i for i in self.result.issues
-                         if i.severity in (Severity.CRITICAL, Severity.ERROR)]
+        # Critical/Error issues - totals come from the severity counts, only
+        # the displayed slice is pulled from the issue list
+        critical_count = (severity_counts[Severity.CRITICAL.value]
+                          + severity_counts[Severity.ERROR.value])
 
-        if critical_errors:
+        if critical_count > 0:
+            critical_errors = (i for i in self.result.issues
+                               if i.severity in (Severity.CRITICAL, Severity.ERROR))
             print("CRITICAL/ERROR ISSUES")
             print("-" * 40)
-            for issue in critical_errors[:20]:  # Limit output
+            for issue in islice(critical_errors, 20):  # Limit output
                 print(f"  [{issue.severity.value}] {issue.file}:{issue.line}")
                 print(f"    {issue.message}")
                 print(f"    Suggestion: {issue.suggestion}")
-            if len(critical_errors) > 20:
-                print(f"  ... and {len(critical_errors) - 20} more")
+            if critical_count > 20:
+                print(f"  ... and {critical_count - 20} more")
             print()
 
         # Warnings (if verbose)
         if verbose:
-            warnings = [i for i in self.result.issues if i.severity == Severity.WARNING]
-            if warnings:
+            warning_count = severity_counts[Severity.WARNING.value]
+            if warning_count > 0:
+                warnings = (i for i in self.result.issues if i.severity == Severity.WARNING)
                 print("WARNINGS")
                 print("-" * 40)
-                for issue in warnings[:30]:
+                for issue in islice(warnings, 30):
                     print(f"  {issue.file}:{issue.line} - {issue.rule}")
-                if len(warnings) > 30:
-                    print(f"  ... and {len(warnings) - 30} more")
+                if warning_count > 30:
+                    print(f"  ... and {warning_count - 30} more")
                 print()
 
         # Status
         print("=" * 70)
-        critical_count = sum(1 for i in self.result.issues
-                            if i.severity in (Severity.CRITICAL, Severity.ERROR))
         if critical_count == 0:
             print("✓ AUDIT PASSED - No critical issues found")
         else:
@@ -744,27 +1139,62 @@ class MQL5SuperAudit:
 
     def to_json(self) -> str:
         """Export results as JSON"""
-        return json.dumps({
-            "summary": {
-                "files_scanned": self.result.total_files,
-                "lines_scanned": self.result.total_lines,
-                "total_issues": len(self.result.issues),
-                "by_severity": self.result.count_by_severity(),
-                "by_category": self.result.count_by_category(),
-            },
-            "issues": [
-                {
-                    "file": i.file,
-                    "line": i.line,
-                    "category": i.category.value,
-                    "severity": i.severity.value,
-                    "rule": i.rule,
-                    "message": i.message,
-                    "suggestion": i.suggestion,
-                }
-                for i in self.result.issues
-            ]
+        buffer = io.StringIO()
+        self.write_json(buffer)
+        return buffer.getvalue()
+
+    def write_json(self, stream: TextIO):
+        """Write the JSON report to a text stream, one issue at a time.
+
+        Produces exactly what json.dumps(report, indent=2) would, without
+        building a dict per issue for the whole run first.
+        """
+        summary = json.dumps({
+            "files_scanned": self.result.total_files,
+            "lines_scanned": self.result.total_lines,
+            "total_issues": len(self.result.issues),
+            "by_severity": self.result.count_by_severity(),
+            "by_category": self.result.count_by_category(),
         }, indent=2)
+        stream.write('{\n  "summary": ')
+        stream.write(summary.replace('\n', '\n  '))
+        stream.write(',\n  "issues": [')
+
+        dumps = json.dumps
+        for n, i in enumerate(self.result.issues):
+            stream.write(',\n    ' if n else '\n    ')
+            stream.write(dumps({
+                "file": i.file,
+                "line": i.line,
+                "category": i.category.value,
+                "severity": i.severity.value,
+                "rule": i.rule,
+                "message": i.message,
+                "suggestion": i.suggestion,
+            }, indent=2).replace('\n', '\n    '))
+
+        stream.write('\n  ]\n}' if self.result.issues else ']\n}')
+
+
+MQL5SuperAudit._compile_patterns()
+
+
+# Per-process auditor for MQL5SuperAudit._audit_files worker pools
+_worker_auditor: Optional[MQL5SuperAudit] = None
+
+
+def _init_worker(project_root: Path, cache_path: Optional[Path], cache: Dict[str, Dict]):
+    global _worker_auditor
+    _worker_auditor = MQL5SuperAudit(project_root, cache_path=cache_path)
+    _worker_auditor._cache = cache
+
+
+def _audit_file_worker(file_path: Path):
+    """Audit one file in a worker; returns (audit_file result, cache entries to merge)"""
+    result = _worker_auditor._audit_file_safe(file_path)
+    cache_updates = _worker_auditor._cache_updates
+    _worker_auditor._cache_updates = {}
+    return result, cache_updates
 
 
 def main():
@@ -810,6 +1240,21 @@ DO NO HARM Principle:
         action="store_true",
         help="Exit with code 1 if errors found"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for large audits (default: CPU count, 1 = serial)"
+    )
+    parser.add_argument(
+        "--cache-file",
+        help=f"Per-file result cache (default: <project>/{MQL5SuperAudit.CACHE_FILENAME})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Audit every file from scratch and do not write the cache"
+    )
 
     args = parser.parse_args()
 
@@ -822,8 +1267,13 @@ DO NO HARM Principle:
         print(f"Error: Project path is not a directory: {project_path}")
         sys.exit(2)
 
+    if args.no_cache:
+        cache_path = None
+    else:
+        cache_path = Path(args.cache_file) if args.cache_file else project_path / MQL5SuperAudit.CACHE_FILENAME
+
     try:
-        auditor = MQL5SuperAudit(project_path)
+        auditor = MQL5SuperAudit(project_path, cache_path=cache_path, jobs=args.jobs)
         auditor.run_audit()
         passed = auditor.print_report(verbose=args.verbose)
     except KeyboardInterrupt:
@@ -839,7 +1289,7 @@ DO NO HARM Principle:
             # Ensure parent directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(auditor.to_json())
+                auditor.write_json(f)
             print(f"\nJSON report saved to: {args.output}")
         except PermissionError:
             print(f"Error: Permission denied writing to: {args.output}")
@@ -5,9 +5,102 @@ Reviews all MT5 directories for correct layout and identifies issues
 """
 
 import os
+import sys
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from itertools import combinations
 import json
 
+# Top-level MQL5 folders the terminal expects
+_STANDARD_FOLDERS = frozenset(("Experts", "Include", "Indicators", "Scripts", "Libraries", "Files", "Images"))
+# Project folders that belong inside Experts or Scripts, not at the MQL5 root
+_WRONG_LEVEL_CHILD = frozenset(("Main", "Tests", "Documentation"))
+# Source files that should never sit directly in the MQL5 root (a tuple,
+# so it can go straight to str.endswith)
+_CODE_SUFFIXES = (".mq5", ".mqh")
+# Tool and editor directories that never hold MQL5 sources - not descended into
+_PRUNE = frozenset((".git", ".vs", ".idea", "__pycache__", "node_modules", ".venv", "venv"))
+
+
+def _scandir_recursive(path):
+    """Yield an os.DirEntry for everything below path, like Path.rglob("*").
+
+    Each directory's entries come before those of its subdirectories.
+    Symlinked directories and those named in _PRUNE are not descended
+    into, and unreadable subdirectories are skipped. DirEntry answers is_dir()/is_file() from the directory
+    listing, so no extra stat() is needed per entry.
+    """
+    with os.scandir(path) as it:
+        entries = list(it)
+    yield from entries
+    for entry in entries:
+        if entry.name not in _PRUNE and entry.is_dir(follow_symlinks=False):
+            try:
+                yield from _scandir_recursive(entry.path)
+            except OSError:
+                continue
+
+
+def _count_entries(path, suffix):
+    """Count entries below path whose name ends with suffix.
+
+    Only names are needed, so this is a plain top-down os.walk: it hands
+    back directory and file names already split, and pruning is a slice
+    assignment on the directory list. Symlinked directories and those in
+    _PRUNE are not descended into and unreadable subdirectories are
+    skipped; an unreadable path itself raises OSError.
+    """
+    top = os.fspath(path)
+
+    def on_error(error):
+        if error.filename == top:
+            raise error
+
+    count = 0
+    for _, dirs, files in os.walk(top, topdown=True, onerror=on_error, followlinks=False):
+        count += sum(1 for name in dirs if name.endswith(suffix))
+        count += sum(1 for name in files if name.endswith(suffix))
+        dirs[:] = [d for d in dirs if d not in _PRUNE]
+    return count
+
+
+def _is_duplicate_pq(entry):
+    """Whether a DirEntry is a ProjectQuantum look-alike directory"""
+    try:
+        return entry.is_dir() and "ProjectQuantum" in entry.name and entry.name != "ProjectQuantum"
+    except OSError:
+        return False
+
+
+def _find_duplicate_pq(directory, found):
+    """Append the ProjectQuantum look-alike directories below directory to found.
+
+    Only directories are examined, and a duplicate is not descended
+    into - anything nested inside it goes with it. Unreadable
+    directories are skipped.
+    """
+    try:
+        with os.scandir(directory) as it:
+            subdirs = [e for e in it if _is_duplicate_pq(e) or e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+    descend = []
+    for entry in subdirs:
+        if _is_duplicate_pq(entry):
+            found.append(entry.path)
+        elif entry.name not in _PRUNE and not entry.is_symlink():
+            descend.append(entry.path)
+    for subdir in descend:
+        _find_duplicate_pq(subdir, found)
+
+
+def _write_lines(lines):
+    """Write buffered output lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
 class MT5StructureAuditor:
     def __init__(self):
         self.mt5_dev = Path("/mnt/c/DevCenter/MT5-Unified/MQL5-Development")
@@ -28,23 +121,220 @@ class MT5StructureAuditor:
             "Images": "Image resources"
         }
         
-        self.issues = []
+        # Insertion-ordered set: an issue reported twice is listed once
+        self.issues = {}
         self.report = {}
-    
+        # One directory walk per MQL5 root, shared by every audit step
+        self._walks = {}
+        # stat() results (or the OSError) for paths probed outside a walk
+        self._stats = {}
+        # Per-root {folder: (mtime_ns, file_count, duplicate_pq)} from the
+        # previous report, for folders that can skip their recursive scan
+        self._previous = {}
+
+    def _issue(self, message):
+        """Record an issue, ignoring repeats of one already recorded"""
+        self.issues[message] = None
+
+    def _report_locations(self):
+        """Candidate report paths, in the order they are tried"""
+        return [
+            Path("/home/renier/ProjectQuantum-Full/mt5_structure_audit_report.json"),
+            Path.cwd() / "mt5_structure_audit_report.json",
+            Path.home() / "mt5_structure_audit_report.json",
+        ]
+
+    def _load_previous_scan(self):
+        """Read folder mtimes and counts back from the last saved report.
+
+        Returns {root path: {folder: (mtime_ns, file_count, duplicate_pq)}}
+        for every standard folder the report recorded an mtime for, or {}
+        if there is no readable report.
+        """
+        for report_file in self._report_locations():
+            try:
+                with open(report_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                break
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError):
+                return {}
+        else:
+            return {}
+
+        try:
+            results = data["audit_results"]
+            terminals = results.get("terminals", {})
+            roots = [(self.mt5_dev, results.get("development"))]
+            roots.extend((path, terminals.get(path.parent.name)) for path in self.terminal_paths)
+            previous = {}
+            for path, audit_result in roots:
+                if not audit_result or not audit_result.get("exists"):
+                    continue
+                duplicates = audit_result.get("duplicate_pq_dirs", [])
+                folders = {}
+                for folder, info in audit_result.get("standard_folders", {}).items():
+                    if info.get("mtime_ns") is None:
+                        continue
+                    prefix = os.path.join(os.fspath(path), folder) + os.sep
+                    folders[folder] = (info["mtime_ns"], info["file_count"],
+                                       [d for d in duplicates if d.startswith(prefix)])
+                previous[os.fspath(path)] = folders
+            return previous
+        except (AttributeError, KeyError, TypeError):
+            return {}  # Report from an older layout - rescan everything
+
+    def _stat(self, path):
+        """os.stat() a path at most once per audit run.
+
+        Returns the stat result, or the OSError it raised, so callers can
+        tell "missing" from "unreadable" without probing again.
+        """
+        key = os.fspath(path)
+        try:
+            return self._stats[key]
+        except KeyError:
+            pass
+        try:
+            result = os.stat(key)
+        except OSError as e:
+            result = e
+        self._stats[key] = result
+        return result
+
+    def _walk_mql5(self, path):
+        """Walk an MQL5 root once and collect what every audit step needs.
+
+        Returns {"children": root entries, "index": root entries by name,
+        "folder_index": entries directly inside each standard folder by
+        name, "file_counts": entries with a dot in their name per standard
+        folder, "mtimes": st_mtime_ns per standard folder, "experts": set of .mq5 names
+        under Experts (None if there is no Experts folder), "duplicate_pq":
+        ProjectQuantum look-alike folders below the root, not counting
+        those nested inside another, "count_errors": the OSError for each
+        standard folder that could not be listed, which gets no file count}.
+        In an incremental run, a standard folder other than Experts whose
+        mtime matches the previous report reuses that report's count and
+        duplicates instead of being scanned recursively. A folder's mtime
+        only changes with its direct entries, so anything added or removed
+        deeper down is missed until the next full run.
+        Raises OSError if the root itself cannot be listed; that outcome is
+        memoized too, so a missing root costs one failed scandir per run.
+        """
+        key = os.fspath(path)
+        walk = self._walks.get(key)
+        if isinstance(walk, OSError):
+            raise walk
+        if walk is not None:
+            return walk
+
+        try:
+            with os.scandir(key) as it:
+                children = list(it)
+        except OSError as e:
+            self._walks[key] = e
+            raise
+        walk = {"children": children, "index": {e.name: e for e in children}, "folder_index": {},
+                "file_counts": {}, "mtimes": {}, "experts": None, "duplicate_pq": [], "count_errors": {}}
+        previous = self._previous.get(key, {})
+
+        walk["duplicate_pq"].extend(e.path for e in children if _is_duplicate_pq(e))
+        for child in children:
+            try:
+                if not child.is_dir():
+                    continue
+            except OSError:
+                continue
+            if child.name in _STANDARD_FOLDERS:
+                self._walk_standard_folder(child, walk, previous.get(child.name))
+            elif child.name not in _PRUNE and not child.is_symlink() and not _is_duplicate_pq(child):
+                # Nothing is counted here, so only the duplicate search
+                # needs to go below it
+                _find_duplicate_pq(child.path, walk["duplicate_pq"])
+
+        self._walks[key] = walk
+        return walk
+
+    @staticmethod
+    def _walk_standard_folder(folder, walk, previous):
+        """Index, count and search one standard folder into a _walk_mql5 result.
+
+        previous is the folder's (mtime_ns, file_count, duplicate_pq) from
+        the last report, or None to always scan it recursively.
+        """
+        name = folder.name
+        index = walk["folder_index"][name] = {}
+        try:
+            mtime = walk["mtimes"][name] = folder.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+
+        # Experts is always scanned: the cross-terminal check needs its names
+        if name != "Experts" and previous is not None and previous[0] == mtime:
+            try:
+                with os.scandir(folder.path) as it:
+                    index.update((entry.name, entry) for entry in it)
+            except OSError as e:
+                walk["count_errors"][name] = e
+                return
+            walk["file_counts"][name] = previous[1]
+            walk["duplicate_pq"].extend(previous[2])
+            return
+
+        # The duplicate search does not follow a symlinked top-level
+        # folder, the per-folder file count does
+        search_duplicates = not folder.is_symlink()
+        inside_duplicate = ()
+        experts = set() if name == "Experts" else None
+        count = 0
+        direct_child_length = len(folder.path) + 1
+        try:
+            for entry in _scandir_recursive(folder.path):
+                entry_name = entry.name
+                if len(entry.path) == direct_child_length + len(entry_name):
+                    index[entry_name] = entry
+                if "." in entry_name:
+                    count += 1
+                    if experts is not None and entry_name.endswith(".mq5"):
+                        experts.add(entry_name)
+                if (search_duplicates and _is_duplicate_pq(entry)
+                        and not entry.path.startswith(inside_duplicate)):
+                    walk["duplicate_pq"].append(entry.path)
+                    inside_duplicate += (entry.path + os.sep,)
+        except OSError as e:
+            # Unreadable folder - reported by the audit instead of a count
+            walk["count_errors"][name] = e
+            return
+        walk["file_counts"][name] = count
+        if experts is not None:
+            walk["experts"] = experts
+
     def audit_directory(self, path, name):
         """Audit a single MT5 directory"""
-        print(f"\n🔍 Auditing: {name}")
-        print(f"   Path: {path}")
+        lines, issues = [], []
+        audit_result = self._audit_directory(path, name, lines, issues)
+        _write_lines(lines)
+        self.issues.update(dict.fromkeys(issues))
+        return audit_result
+
+    def _audit_directory(self, path, name, lines, issues):
+        """audit_directory that collects its output lines and issues instead
+        of printing them, so several directories can be audited at once"""
+        out = lines.append
+        out(f"\n🔍 Auditing: {name}")
+        out(f"   Path: {path}")
 
+        # Listing the root also tells whether it exists - no separate stat()
         try:
-            if not path.exists():
-                print(f"   ❌ Directory not found")
-                self.issues.append(f"{name}: Directory not found")
-                return {"exists": False}
+            walk = self._walk_mql5(path)
+        except FileNotFoundError:
+            out(f"   ❌ Directory not found")
+            issues.append(f"{name}: Directory not found")
+            return {"exists": False}
         except (OSError, PermissionError) as e:
-            print(f"   ❌ Cannot access directory: {e}")
-            self.issues.append(f"{name}: Cannot access directory - {e}")
-            return {"exists": False, "error": str(e)}
+            walk = None
+            error = e
 
         audit_result = {
             "exists": True,
@@ -52,261 +342,322 @@ class MT5StructureAuditor:
             "unexpected_folders": [],
             "file_counts": {},
             "duplicates": [],
-            "wrong_level_items": []
+            "wrong_level_items": [],
+            "orphan_files": [],
+            "duplicate_pq_dirs": []
         }
 
+        if walk is None:
+            out(f"   ⚠️  Cannot list directory contents: {error}")
+            issues.append(f"{name}: Cannot list directory - {error}")
+            return audit_result
+        items = walk["children"]
+        present = walk["index"]
+        audit_result["duplicate_pq_dirs"].extend(walk["duplicate_pq"])
+
         # Check for standard folders
         for folder, description in self.standard_folders.items():
-            folder_path = path / folder
             try:
-                if folder_path.exists():
-                    try:
-                        file_count = len(list(folder_path.rglob("*.*")))
-                    except (OSError, PermissionError) as e:
-                        file_count = -1
-                        print(f"   ⚠️  {folder}/ (error counting files: {e})")
+                if folder in present:
+                    count_error = walk["count_errors"].get(folder)
+                    if count_error is not None:
+                        out(f"   ⚠️  {folder}/ (error counting files: {count_error})")
                         continue
+                    file_count = walk["file_counts"].get(folder, 0)
                     audit_result["standard_folders"][folder] = {
                         "exists": True,
                         "file_count": file_count,
-                        "description": description
+                        "description": description,
+                        "mtime_ns": walk["mtimes"].get(folder)
                     }
-                    print(f"   ✅ {folder}/ ({file_count} files) - {description}")
+                    out(f"   ✅ {folder}/ ({file_count} files) - {description}")
                 else:
                     audit_result["standard_folders"][folder] = {"exists": False}
-                    print(f"   ⚪ {folder}/ - Missing")
+                    out(f"   ⚪ {folder}/ - Missing")
             except (OSError, PermissionError) as e:
                 audit_result["standard_folders"][folder] = {"exists": False, "error": str(e)}
-                print(f"   ⚠️  {folder}/ - Cannot check: {e}")
+                out(f"   ⚠️  {folder}/ - Cannot check: {e}")
 
         # Check for unexpected items
-        try:
-            items = list(path.iterdir())
-        except (OSError, PermissionError) as e:
-            print(f"   ⚠️  Cannot list directory contents: {e}")
-            self.issues.append(f"{name}: Cannot list directory - {e}")
-            return audit_result
-
         for item in items:
             try:
                 if item.is_dir():
                     folder_name = item.name
-                    if folder_name not in self.standard_folders:
+                    if folder_name not in _STANDARD_FOLDERS:
                         audit_result["unexpected_folders"].append(folder_name)
 
                         # Check for common issues
                         if "ProjectQuantum" in folder_name and folder_name != "ProjectQuantum":
-                            print(f"   ⚠️  Unexpected: {folder_name}/ (potential duplicate)")
-                            self.issues.append(f"{name}: Duplicate ProjectQuantum folder - {folder_name}")
-                        elif folder_name in ["Main", "Tests", "Documentation"]:
-                            print(f"   ❌ Wrong level: {folder_name}/ (should be inside Experts or Scripts)")
-                            self.issues.append(f"{name}: Wrong level folder - {folder_name}")
+                            out(f"   ⚠️  Unexpected: {folder_name}/ (potential duplicate)")
+                            issues.append(f"{name}: Duplicate ProjectQuantum folder - {folder_name}")
+                        elif folder_name in _WRONG_LEVEL_CHILD:
+                            out(f"   ❌ Wrong level: {folder_name}/ (should be inside Experts or Scripts)")
+                            issues.append(f"{name}: Wrong level folder - {folder_name}")
                             audit_result["wrong_level_items"].append(folder_name)
                         elif folder_name.startswith("."):
-                            print(f"   ⚪ Hidden: {folder_name}/")
+                            out(f"   ⚪ Hidden: {folder_name}/")
                         else:
-                            print(f"   ❓ Unexpected: {folder_name}/")
+                            out(f"   ❓ Unexpected: {folder_name}/")
                 elif item.is_file():
                     # Files directly in MQL5 root
-                    if item.suffix in [".mq5", ".mqh"]:
-                        print(f"   ❌ Wrong level: {item.name} (should be in appropriate subfolder)")
+                    if item.name.endswith(_CODE_SUFFIXES):
+                        out(f"   ❌ Wrong level: {item.name} (should be in appropriate subfolder)")
                         audit_result["wrong_level_items"].append(item.name)
-                        self.issues.append(f"{name}: File in wrong location - {item.name}")
+                        audit_result["orphan_files"].append(item.name)
+                        issues.append(f"{name}: File in wrong location - {item.name}")
                     else:
-                        print(f"   ℹ️  Root file: {item.name}")
+                        out(f"   ℹ️  Root file: {item.name}")
             except (OSError, PermissionError) as e:
-                print(f"   ⚠️  Cannot access item: {e}")
+                out(f"   ⚠️  Cannot access item: {e}")
 
         return audit_result
     
     def check_duplicates_across_terminals(self):
         """Check for duplicate structures across different terminals"""
-        print(f"\n🔍 Checking for duplicate structures across terminals...")
-
-        terminal_structures = {}
-        for terminal_path in self.terminal_paths:
-            try:
-                if terminal_path.exists():
-                    experts_path = terminal_path / "Experts"
-                    try:
-                        if experts_path.exists():
-                            try:
-                                experts = [f.name for f in experts_path.rglob("*.mq5")]
-                                terminal_structures[terminal_path.name] = experts
-                            except (OSError, PermissionError) as e:
-                                print(f"   ⚠️  Cannot scan {terminal_path.name}/Experts: {e}")
-                    except (OSError, PermissionError) as e:
-                        print(f"   ⚠️  Cannot access Experts in {terminal_path.name}: {e}")
-            except (OSError, PermissionError) as e:
-                print(f"   ⚠️  Cannot check terminal {terminal_path}: {e}")
-
-        if not terminal_structures:
-            print("   ℹ️  No terminal structures found to compare")
-            return
+        lines = []
+        out = lines.append
+        try:
+            out(f"\n🔍 Checking for duplicate structures across terminals...")
 
-        # Compare structures
-        all_terminals = list(terminal_structures.keys())
-        for i, terminal1 in enumerate(all_terminals):
-            for terminal2 in all_terminals[i+1:]:
+            terminal_structures = {}
+            for terminal_path in self.terminal_paths:
                 try:
-                    common_files = set(terminal_structures[terminal1]) & set(terminal_structures[terminal2])
+                    experts = self._walk_mql5(terminal_path)["experts"]
+                except FileNotFoundError:
+                    continue
+                except (OSError, PermissionError) as e:
+                    out(f"   ⚠️  Cannot check terminal {terminal_path}: {e}")
+                    continue
+                if experts is not None:
+                    terminal_structures[terminal_path.name] = experts
+
+            if not terminal_structures:
+                out("   ℹ️  No terminal structures found to compare")
+                return
+
+            # Compare structures: one pass counts how many terminals have each
+            # name, so each pair only intersects the names seen more than once.
+            # The walk already hands back sets, so nothing is re-hashed here
+            names_by_terminal = terminal_structures
+            terminal_counts = Counter()
+            for names in names_by_terminal.values():
+                terminal_counts.update(names)
+            shared_names = {name for name, count in terminal_counts.items() if count > 1}
+
+            if shared_names:
+                for terminal1, terminal2 in combinations(names_by_terminal, 2):
+                    common_files = shared_names & names_by_terminal[terminal1] & names_by_terminal[terminal2]
                     if common_files:
-                        print(f"   ⚠️  Duplicates between {terminal1} and {terminal2}: {len(common_files)} files")
-                        self.issues.append(f"Duplicate files between terminals {terminal1} and {terminal2}")
-                except (KeyError, TypeError) as e:
-                    print(f"   ⚠️  Error comparing terminals: {e}")
+                        out(f"   ⚠️  Duplicates between {terminal1} and {terminal2}: {len(common_files)} files")
+                        self._issue(f"Duplicate files between terminals {terminal1} and {terminal2}")
+        finally:
+            _write_lines(lines)
     
-    def analyze_project_specific_structure(self):
-        """Analyze ProjectQuantum specific folder organization"""
-        print(f"\n🎯 Analyzing ProjectQuantum Structure...")
+    def _dev_listing(self, folder):
+        """Entries directly inside a development standard folder, by name.
 
-        # Check development structure
-        dev_experts = self.mt5_dev / "Experts" / "ProjectQuantum"
-        dev_includes = self.mt5_dev / "Include" / "ProjectQuantum"
-        dev_master_include = self.mt5_dev / "Include" / "ProjectQuantum.mqh"
+        Returns None when the walk cannot answer for the folder - the root
+        or the folder itself could not be listed - so the caller probes the
+        path instead. A folder that is not there has no entries.
+        """
+        try:
+            walk = self._walk_mql5(self.mt5_dev)
+        except (OSError, PermissionError):
+            return None
+        if folder in walk["count_errors"]:
+            return None
+        listing = walk["folder_index"].get(folder)
+        if listing is None and folder in walk["index"]:
+            return None  # Present but not walked (e.g. is_dir() failed)
+        return listing if listing is not None else {}
 
+    def analyze_project_specific_structure(self):
+        """Analyze ProjectQuantum specific folder organization"""
+        lines = []
+        out = lines.append
         try:
-            if dev_experts.exists():
-                try:
-                    ea_count = len(list(dev_experts.glob("*.mq5")))
-                    print(f"   ✅ Dev Experts/ProjectQuantum/ ({ea_count} EAs)")
-                except (OSError, PermissionError) as e:
-                    print(f"   ⚠️  Dev Experts/ProjectQuantum/ exists but cannot count files: {e}")
-            else:
-                print(f"   ❌ Dev Experts/ProjectQuantum/ missing")
-                self.issues.append("ProjectQuantum: Missing Experts folder in development")
+            out(f"\n🎯 Analyzing ProjectQuantum Structure...")
+
+            # Check development structure
+            self._check_dev_experts(out)
+            self._check_dev_includes(out)
+            self._check_dev_master_include(out)
+        finally:
+            _write_lines(lines)
+
+    def _known_missing(self, folder, name):
+        """Whether the development walk listed folder and name was not in it"""
+        listing = self._dev_listing(folder)
+        return listing is not None and name not in listing
+
+    def _check_dev_experts(self, out):
+        """Report the EAs in the development Experts/ProjectQuantum folder"""
+        # Plain string paths, since they only ever go to os.scandir()/os.path
+        dev_experts = os.path.join(os.fspath(self.mt5_dev), "Experts", "ProjectQuantum")
+        # Scan directly - a missing folder shows up as FileNotFoundError,
+        # so there is no exists() stat() before the scan
+        try:
+            if self._known_missing("Experts", "ProjectQuantum"):
+                raise FileNotFoundError(dev_experts)
+            with os.scandir(dev_experts) as it:
+                ea_count = sum(1 for e in it if e.name.endswith(".mq5"))
+            out(f"   ✅ Dev Experts/ProjectQuantum/ ({ea_count} EAs)")
+        except FileNotFoundError:
+            out(f"   ❌ Dev Experts/ProjectQuantum/ missing")
+            self._issue("ProjectQuantum: Missing Experts folder in development")
         except (OSError, PermissionError) as e:
-            print(f"   ⚠️  Cannot check Experts/ProjectQuantum: {e}")
+            out(f"   ⚠️  Dev Experts/ProjectQuantum/ exists but cannot count files: {e}")
 
+    def _check_dev_includes(self, out):
+        """Report the headers and subfolders of the development Include/ProjectQuantum folder"""
+        dev_includes = os.path.join(os.fspath(self.mt5_dev), "Include", "ProjectQuantum")
         try:
-            if dev_includes.exists():
-                try:
-                    include_count = len(list(dev_includes.rglob("*.mqh")))
-                    subdirs = [d.name for d in dev_includes.iterdir() if d.is_dir()]
-                    print(f"   ✅ Dev Include/ProjectQuantum/ ({include_count} files in {len(subdirs)} subdirs)")
-                    if subdirs:
-                        print(f"      Subdirs: {', '.join(subdirs)}")
-                except (OSError, PermissionError) as e:
-                    print(f"   ⚠️  Dev Include/ProjectQuantum/ exists but cannot enumerate: {e}")
-            else:
-                print(f"   ❌ Dev Include/ProjectQuantum/ missing")
-                self.issues.append("ProjectQuantum: Missing Include folder in development")
+            if self._known_missing("Include", "ProjectQuantum"):
+                raise FileNotFoundError(dev_includes)
+            with os.scandir(dev_includes) as it:
+                subdirs = [e.name for e in it if e.is_dir()]
+            include_count = _count_entries(dev_includes, ".mqh")
+            out(f"   ✅ Dev Include/ProjectQuantum/ ({include_count} files in {len(subdirs)} subdirs)")
+            if subdirs:
+                out(f"      Subdirs: {', '.join(subdirs)}")
+        except FileNotFoundError:
+            out(f"   ❌ Dev Include/ProjectQuantum/ missing")
+            self._issue("ProjectQuantum: Missing Include folder in development")
         except (OSError, PermissionError) as e:
-            print(f"   ⚠️  Cannot check Include/ProjectQuantum: {e}")
+            out(f"   ⚠️  Dev Include/ProjectQuantum/ exists but cannot enumerate: {e}")
 
+    def _check_dev_master_include(self, out):
+        """Report whether the development Include/ProjectQuantum.mqh exists"""
         try:
-            if dev_master_include.exists():
-                print(f"   ✅ Dev Include/ProjectQuantum.mqh (master include)")
+            # Answered from the Include/ listing when the walk has one
+            listing = self._dev_listing("Include")
+            if listing is not None:
+                master_include_exists = "ProjectQuantum.mqh" in listing
+            else:
+                dev_master_include = os.path.join(os.fspath(self.mt5_dev), "Include", "ProjectQuantum.mqh")
+                master_include_exists = not isinstance(self._stat(dev_master_include), OSError)
+            if master_include_exists:
+                out(f"   ✅ Dev Include/ProjectQuantum.mqh (master include)")
             else:
-                print(f"   ❌ Dev Include/ProjectQuantum.mqh missing")
-                self.issues.append("ProjectQuantum: Missing master include file")
+                out(f"   ❌ Dev Include/ProjectQuantum.mqh missing")
+                self._issue("ProjectQuantum: Missing master include file")
         except (OSError, PermissionError) as e:
-            print(f"   ⚠️  Cannot check ProjectQuantum.mqh: {e}")
+            out(f"   ⚠️  Cannot check ProjectQuantum.mqh: {e}")
     
     def generate_cleanup_recommendations(self):
         """Generate specific cleanup recommendations"""
-        print(f"\n💡 CLEANUP RECOMMENDATIONS")
-        print("=" * 50)
-
-        recommendations = []
-
-        # Build list of existing paths to check
-        paths_to_check = [self.mt5_dev]
-        for p in self.terminal_paths:
-            try:
-                if p.exists():
-                    paths_to_check.append(p)
-            except (OSError, PermissionError):
-                continue
-
-        # Check for wrong-level folders
-        wrong_level_folders = []
-        for path in paths_to_check:
-            try:
-                for item in path.iterdir():
-                    try:
-                        if item.is_dir() and item.name in ["Main", "Tests", "Documentation", "Scripts"]:
-                            if item.name not in ["Scripts", "Libraries", "Files"]:  # Scripts is valid at root
-                                wrong_level_folders.append((path, item.name))
-                    except (OSError, PermissionError):
-                        continue
-            except (OSError, PermissionError) as e:
-                print(f"   ⚠️  Cannot check {path}: {e}")
-
-        if wrong_level_folders:
-            recommendations.append("MOVE WRONG-LEVEL FOLDERS:")
-            for path, folder in wrong_level_folders:
-                if folder == "Main":
-                    recommendations.append(f"   Move {path}/{folder}/*.mq5 → {path}/Experts/ProjectQuantum/")
-                elif folder == "Tests":
-                    recommendations.append(f"   Move {path}/{folder}/*.mq5 → {path}/Scripts/ProjectQuantum/")
-                elif folder == "Documentation":
-                    recommendations.append(f"   Move {path}/{folder} → {path}/Files/Documentation/")
-
-        # Check for duplicate project folders
-        duplicate_project_folders = []
-        for path in paths_to_check:
-            try:
-                for item in path.rglob("*"):
-                    try:
-                        if item.is_dir() and "ProjectQuantum" in item.name and item.name != "ProjectQuantum":
-                            duplicate_project_folders.append(item)
-                    except (OSError, PermissionError):
-                        continue
-            except (OSError, PermissionError) as e:
-                print(f"   ⚠️  Cannot scan {path} for duplicates: {e}")
+        lines = []
+        out = lines.append
+        try:
+            out(f"\n💡 CLEANUP RECOMMENDATIONS")
+            out("=" * 50)
 
-        if duplicate_project_folders:
-            recommendations.append("\nREMOVE DUPLICATE PROJECT FOLDERS:")
-            for folder in duplicate_project_folders:
-                recommendations.append(f"   Remove: {folder}")
+            recommendations = []
 
-        # Check for orphaned files
-        orphaned_files = []
-        for path in paths_to_check:
+            # Wrong-level folders, duplicate project folders and orphaned files
+            # are all read back from the audit results already in the report
+            wrong_level_folders = []
+            duplicate_project_folders = []
+            orphaned_files = []
+            terminals = self.report.get("terminals", {})
+            audited = [(self.mt5_dev, self.report.get("development"))]
+            audited.extend((path, terminals.get(path.parent.name)) for path in self.terminal_paths)
+            for path, audit_result in audited:
+                if not audit_result or not audit_result.get("exists"):
+                    continue  # audit_directory has already reported why
+                # Scripts, Libraries and Files are valid at root
+                wrong_level_folders.extend((path, item) for item in audit_result["wrong_level_items"]
+                                           if item in _WRONG_LEVEL_CHILD)
+                duplicate_project_folders.extend(audit_result["duplicate_pq_dirs"])
+                orphaned_files.extend(audit_result["orphan_files"])
+
+            if wrong_level_folders:
+                recommendations.append("MOVE WRONG-LEVEL FOLDERS:")
+                for path, folder in wrong_level_folders:
+                    if folder == "Main":
+                        recommendations.append(f"   Move {path}/{folder}/*.mq5 → {path}/Experts/ProjectQuantum/")
+                    elif folder == "Tests":
+                        recommendations.append(f"   Move {path}/{folder}/*.mq5 → {path}/Scripts/ProjectQuantum/")
+                    elif folder == "Documentation":
+                        recommendations.append(f"   Move {path}/{folder} → {path}/Files/Documentation/")
+
+            if duplicate_project_folders:
+                recommendations.append("\nREMOVE DUPLICATE PROJECT FOLDERS:")
+                for folder in duplicate_project_folders:
+                    recommendations.append(f"   Remove: {folder}")
+
+            if orphaned_files:
+                recommendations.append("\nMOVE ORPHANED FILES:")
+                for file in orphaned_files:
+                    if file.endswith(".mq5"):
+                        recommendations.append(f"   Move {file} → Experts/ or Scripts/")
+                    elif file.endswith(".mqh"):
+                        recommendations.append(f"   Move {file} → Include/")
+
+            lines.extend(recommendations)
+
+            return recommendations
+        finally:
+            _write_lines(lines)
+    
+    def _merge_audit_results(self, futures):
+        """Print each directory audit's output and record its issues and
+        result in the report, in task order.
+
+        futures holds (terminal_id or None for development, path, lines,
+        issues, future) per audited directory.
+        """
+        terminals = {}
+        for terminal_id, path, lines, issues, future in futures:
             try:
-                for item in path.glob("*"):
-                    try:
-                        if item.is_file() and item.suffix in [".mq5", ".mqh"]:
-                            orphaned_files.append(item)
-                    except (OSError, PermissionError):
-                        continue
-            except (OSError, PermissionError) as e:
-                print(f"   ⚠️  Cannot scan {path} for orphaned files: {e}")
-
-        if orphaned_files:
-            recommendations.append("\nMOVE ORPHANED FILES:")
-            for file in orphaned_files:
-                if file.suffix == ".mq5":
-                    recommendations.append(f"   Move {file.name} → Experts/ or Scripts/")
-                elif file.suffix == ".mqh":
-                    recommendations.append(f"   Move {file.name} → Include/")
+                audit_result = future.result()
+            except Exception as e:
+                audit_result = None
+                error = e
+            _write_lines(lines)
+            self.issues.update(dict.fromkeys(issues))
+            if audit_result is None:
+                if terminal_id is None:
+                    print(f"   ⚠️  Error auditing development directory: {error}")
+                    audit_result = {"error": str(error)}
+                else:
+                    print(f"   ⚠️  Error auditing terminal {path}: {error}")
+                    continue
+            if terminal_id is None:
+                self.report["development"] = audit_result
+            else:
+                terminals[terminal_id] = audit_result
+        self.report["terminals"] = terminals
 
-        for rec in recommendations:
-            print(rec)
+    def run_full_audit(self, pretty=False, incremental=False):
+        """Run complete MT5 structure audit
 
-        return recommendations
-    
-    def run_full_audit(self):
-        """Run complete MT5 structure audit"""
+        The JSON report is written compact unless pretty is set. With
+        incremental set, folders whose own mtime is unchanged since the
+        last report reuse its file counts and duplicate folders; changes
+        nested below their direct entries then go unnoticed.
+        """
         print("🔍 Complete MT5 Structure Audit")
         print("=" * 50)
-
-        try:
-            # Audit development directory
-            self.report["development"] = self.audit_directory(self.mt5_dev, "Development")
-        except Exception as e:
-            print(f"   ⚠️  Error auditing development directory: {e}")
-            self.report["development"] = {"error": str(e)}
-
-        # Audit terminal directories
-        self.report["terminals"] = {}
+        self._walks = {}
+        self._stats = {}
+        self._previous = self._load_previous_scan() if incremental else {}
+
+        # Audit the development and terminal directories concurrently - each
+        # walk mostly waits on the filesystem. Output and issues are
+        # collected per directory and merged here in the usual order.
+        tasks = [(None, self.mt5_dev, "Development")]
         for terminal_path in self.terminal_paths:
-            try:
-                terminal_id = terminal_path.parent.name
-                self.report["terminals"][terminal_id] = self.audit_directory(terminal_path, f"Terminal-{terminal_id}")
-            except Exception as e:
-                print(f"   ⚠️  Error auditing terminal {terminal_path}: {e}")
+            terminal_id = terminal_path.parent.name
+            tasks.append((terminal_id, terminal_path, f"Terminal-{terminal_id}"))
+
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = []
+            for terminal_id, path, name in tasks:
+                lines, issues = [], []
+                future = executor.submit(self._audit_directory, path, name, lines, issues)
+                futures.append((terminal_id, path, lines, issues, future))
+        self._merge_audit_results(futures)
 
         # Check for cross-terminal duplicates
         try:
@@ -327,37 +678,42 @@ class MT5StructureAuditor:
             print(f"   ⚠️  Error generating recommendations: {e}")
             recommendations = []
 
-        # Summary
-        print(f"\n📊 AUDIT SUMMARY")
-        print("=" * 30)
-        print(f"Issues found: {len(self.issues)}")
-        print(f"Recommendations: {len(recommendations)}")
+        # Summary - built up and written in one go
+        summary = [
+            f"\n📊 AUDIT SUMMARY",
+            "=" * 30,
+            f"Issues found: {len(self.issues)}",
+            f"Recommendations: {len(recommendations)}"
+        ]
 
         if self.issues:
-            print(f"\n❌ ISSUES FOUND:")
-            for i, issue in enumerate(self.issues, 1):
-                print(f"   {i}. {issue}")
+            summary.append(f"\n❌ ISSUES FOUND:")
+            summary.extend(f"   {i}. {issue}" for i, issue in enumerate(self.issues, 1))
+        _write_lines(summary)
 
         # Save report - try multiple locations
         report_data = {
             "audit_results": self.report,
-            "issues": self.issues,
+            "issues": list(self.issues),
             "recommendations": recommendations
         }
 
         # Try to find a writable location for the report
-        report_locations = [
-            Path("/home/renier/ProjectQuantum-Full/mt5_structure_audit_report.json"),
-            Path.cwd() / "mt5_structure_audit_report.json",
-            Path.home() / "mt5_structure_audit_report.json",
-        ]
+        report_locations = self._report_locations()
+
+        # Everything in the report is already a str/int/bool/list/dict
+        json_options = {"indent": 2} if pretty else {"separators": (",", ":")}
 
         report_saved = False
         for report_file in report_locations:
+            # Written beside the target and swapped in, so an interrupted
+            # run never leaves a truncated report behind
+            tmp_file = report_file.with_suffix(".json.tmp")
             try:
                 report_file.parent.mkdir(parents=True, exist_ok=True)
-                with open(report_file, 'w', encoding='utf-8') as f:
-                    json.dump(report_data, f, indent=2, default=str)
+                with open(tmp_file, 'w', encoding='utf-8') as f:
+                    json.dump(report_data, f, **json_options)
+                os.replace(tmp_file, report_file)
                 print(f"\n📄 Full report saved: {report_file}")
                 report_saved = True
                 break
@@ -368,18 +724,33 @@ class MT5StructureAuditor:
             except (TypeError, ValueError) as e:
                 print(f"   ⚠️  Error serializing report: {e}")
                 break
+            finally:
+                if not report_saved:
+                    try:
+                        tmp_file.unlink()
+                    except OSError:
+                        pass
 
         if not report_saved:
             print(f"\n⚠️  Could not save report to any location")
 
         return len(self.issues) == 0
 
+
 if __name__ == "__main__":
-    import sys
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Complete MT5 structure audit")
+    parser.add_argument("--pretty", action="store_true",
+                        help="Indent the JSON report (default: compact)")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Reuse counts from the last report for folders whose own mtime is unchanged "
+                             "(misses changes nested deeper inside them)")
+    args = parser.parse_args()
 
     try:
         auditor = MT5StructureAuditor()
-        success = auditor.run_full_audit()
+        success = auditor.run_full_audit(pretty=args.pretty, incremental=args.incremental)
 
         if success:
             print("\n🎉 MT5 structure audit PASSED - No issues found!")
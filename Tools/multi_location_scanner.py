@@ -12,7 +12,8 @@ Designed to scan:
 
 Features:
 - Deep recursive scanning with configurable depth
-- SHA256 cryptographic hashing
+- Content hashing with BLAKE3 or xxh3-128 when installed (SHA256 with --crypto)
+- Only files whose name is found in several locations are read (--hash-all to read every file)
 - Duplicate detection by filename and by content
 - Version conflict identification
 - Authoritative source determination
@@ -31,31 +32,260 @@ Usage:
     # Analyze results from Windows scan
     python multi_location_scanner.py --analyze scan_results.json
 
+    # Keep a per-file NDJSON of a large scan, then re-analyze it
+    python multi_location_scanner.py --all --ndjson
+    python multi_location_scanner.py --stream-analyze scan_report.json.ndjson
+
 Author: ProjectQuantum Team
 Version: 1.0
 """
 
+import os
 import re
+import sys
 import json
+import mmap
 import hashlib
 import argparse
 from pathlib import Path
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Tuple, Union, Iterable, Iterator
 from collections import defaultdict
 from dataclasses import dataclass, asdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+
+try:
+    import blake3  # Optional: fast content hashing
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash  # Optional: fast content hashing (xxh3-128)
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson  # Optional: faster reading and writing of reports and caches
+except ImportError:
+    orjson = None
+
+# Stored hashes carry their algorithm as a prefix, so scan results and the
+# hash cache stay self-describing
+HASH_PREFIXES = {'blake3': 'b3:', 'xxh3': 'xx:', 'sha256': 'sha256:'}
+
+# Duplicate detection only needs content equality, so the fastest installed
+# hash is the default; SCANNER_HASH overrides it
+DEFAULT_HASH_ALGO = os.environ.get('SCANNER_HASH') or ('blake3' if blake3 else 'xxh3' if xxhash else 'sha256')
+
+# (size, mtime_ns, hash, version) remembered between runs for one path
+CacheEntry = Tuple[int, int, str, Optional[str]]
+
+# Files up to this size are read once and both hashed and searched for
+# their version from that buffer - most .mqh/.mq5 files are a few KiB
+SMALL_FILE_BYTES = 256 * 1024
+
+# #property version is searched for in this many leading bytes, undecoded
+VERSION_SCAN_BYTES = 4096
+_VERSION_RE = re.compile(rb'#property\s+version\s+"([^"]+)"')
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON for obj, with orjson when installed. FileInfo and other
+    dataclasses are serialized as their fields."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, indent=2 if indent else None, default=asdict).encode('utf-8')
+
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, with orjson when installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _new_hasher(algo: str):
+    """Hash object for algo - all of them share hashlib's update()/hexdigest()"""
+    if algo == 'blake3':
+        return blake3.blake3()
+    if algo == 'xxh3':
+        return xxhash.xxh3_128()
+    return hashlib.sha256()
+
+
+def _compute_hash(filepath, algo: str = 'sha256') -> str:
+    """Compute the prefixed content hash of a file, e.g. "b3:<hex>".
+
+    The file is memory-mapped and hashed in a single update() call;
+    empty and unmappable files are read in 1 MiB chunks instead.
+    """
+    try:
+        hasher = _new_hasher(algo)
+        with open(filepath, 'rb') as f:
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    hasher.update(mm)
+            except (ValueError, OSError):
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hasher.update(chunk)
+        return HASH_PREFIXES[algo] + hasher.hexdigest()
+    except Exception as e:
+        return f"ERROR:{e}"
 
 
-@dataclass
+def _match_version(head: bytes) -> Optional[str]:
+    """#property version from the first VERSION_SCAN_BYTES of a file."""
+    match = _VERSION_RE.search(head, 0, VERSION_SCAN_BYTES)
+    return match.group(1).decode('utf-8', errors='ignore') if match else None
+
+
+def _extract_version(filepath) -> Optional[str]:
+    """Extract #property version from MQL5 file."""
+    try:
+        fd = os.open(filepath, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+        try:
+            head = os.read(fd, VERSION_SCAN_BYTES)  # Version is usually near the top
+        finally:
+            os.close(fd)
+        return _match_version(head)
+    except (IOError, OSError):
+        return None
+
+
+def _hash_small_file(path: str, algo: str) -> Tuple[str, Optional[str]]:
+    """Hash and version of a small file from a single open() and read()."""
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except Exception as e:
+        return f"ERROR:{e}", None
+    hasher = _new_hasher(algo)
+    hasher.update(data)
+    return HASH_PREFIXES[algo] + hasher.hexdigest(), _match_version(data)
+
+
+def _cache_valid(cached: Optional[CacheEntry], size: int, mtime_ns: int, algo: str) -> bool:
+    """True if cached matches size and mtime_ns and was hashed with algo."""
+    return (cached is not None and cached[0] == size and cached[1] == mtime_ns
+            and cached[2].startswith(HASH_PREFIXES[algo]))
+
+
+def _hash_and_version(path: str, size: int, mtime_ns: int, cached: Optional[CacheEntry] = None,
+                      algo: str = 'sha256') -> Tuple[str, Optional[str]]:
+    """Content hash and #property version of one file.
+
+    Module-level so worker processes can run it. If cached still matches
+    size and mtime_ns and was hashed with algo, its hash and version are
+    reused and the file is not read. Errors are folded into the result
+    as in compute_hash/extract_version.
+    """
+    if _cache_valid(cached, size, mtime_ns, algo):
+        return cached[2], cached[3]
+    if size <= SMALL_FILE_BYTES:
+        return _hash_small_file(path, algo)
+    return _compute_hash(path, algo), _extract_version(path)
+
+
+# (path, stat result) for a matching file, or the OSError if it could not be stat()ed
+FoundFile = Tuple[str, Union[os.stat_result, OSError]]
+
+
+def _scan_dir(directory: str, extensions, found: List[FoundFile], subdirs: List[str]):
+    """List one directory, adding files with one of extensions to found and
+    subdirectories to subdirs.
+
+    The extension match ignores case. Symlinked directories are not
+    treated as subdirectories, as with rglob. Raises OSError if the
+    directory cannot be listed.
+    """
+    with os.scandir(directory) as it:
+        for entry in it:
+            name = entry.name
+            dot = name.rfind('.')
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                if dot < 0 or name[dot:].lower() not in extensions or not entry.is_file():
+                    continue
+                stat = entry.stat()
+            except OSError as e:
+                stat = e
+            found.append((entry.path, stat))
+
+
+def _walk_mql5_files(top: str, extensions) -> List[FoundFile]:
+    """Every file below top with one of extensions, from one os.scandir pass.
+
+    Unreadable subdirectories are skipped; an unreadable top raises OSError.
+    """
+    found: List[FoundFile] = []
+    stack = [top]
+    while stack:
+        directory = stack.pop()
+        try:
+            _scan_dir(directory, extensions, found, stack)
+        except OSError:
+            if directory is top:
+                raise
+    return found
+
+
+def _walk_subdir(directory: str, extensions) -> List[FoundFile]:
+    """_walk_mql5_files that skips an unreadable directory instead of raising"""
+    try:
+        return _walk_mql5_files(directory, extensions)
+    except OSError:
+        return []
+
+
+def _iter_ndjson(path: Path) -> Iterator['FileInfo']:
+    """FileInfo records from a scan's NDJSON file, one per line."""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield FileInfo(**_json_loads(line))
+
+
+def _file_infos(records: List[Dict[str, Any]]) -> List['FileInfo']:
+    """FileInfo objects from the "files" records of a Windows scan, with
+    equal locations and hashes sharing one string"""
+    interned: Dict[str, str] = {}
+    intern = interned.setdefault
+    return [
+        FileInfo(
+            path=f['path'],
+            relative_path=f['relative_path'],
+            location=sys.intern(f['location']),
+            hash=intern(f['hash'], f['hash']),
+            size=f['size'],
+            modified=f['modified'],
+            version=f.get('version'),
+            filename=os.path.basename(f['path'])
+        )
+        for f in records
+    ]
+
+
+def _format_modified(modified: Union[int, str]) -> str:
+    """FileInfo.modified as an ISO timestamp, formatted only when reported."""
+    if isinstance(modified, int):
+        seconds, nanoseconds = divmod(modified, 10**9)
+        return (datetime.fromtimestamp(seconds) + timedelta(microseconds=round(nanoseconds / 1000))).isoformat()
+    return modified
+
+
+@dataclass(slots=True, frozen=True)
 class FileInfo:
-    """Information about a single file."""
+    """Information about a single file (immutable once scanned)."""
     path: str
     relative_path: str
     location: str  # 'github', 'devcentre', 'terminal_1', etc.
-    hash: str
+    hash: str  # Prefixed with the algorithm: 'b3:', 'xx:' or 'sha256:'; '' if not hashed
     size: int
-    modified: str
+    modified: Union[int, str]  # st_mtime_ns when scanned here, ISO string when loaded from a Windows scan
     version: Optional[str] = None  # Extracted from #property version
+    filename: str = ""  # Last component of path, computed once when scanned/loaded
 
 
 @dataclass
@@ -100,77 +330,311 @@ class MultiLocationScanner:
 
     MQL5_EXTENSIONS = {'.mqh', '.mq5', '.mq4', '.mqt'}
 
-    def __init__(self, locations: Optional[Dict[str, Path]] = None):
+    # Below this many files a process pool costs more than it saves
+    PARALLEL_MIN_FILES = 16
+    # Below this many top-level subdirectories a location is walked serially
+    PARALLEL_MIN_DIRS = 4
+    # Below this many records a loaded scan is converted serially
+    PARALLEL_MIN_RECORDS = 20000
+
+    # Default hash cache, see --no-cache
+    DEFAULT_CACHE_PATH = Path.home() / '.cache' / 'velocitytrader' / 'hash_cache.json'
+    CACHE_VERSION = 1
+    # Paths not seen recently are dropped beyond this many entries
+    CACHE_MAX_ENTRIES = 50000
+
+    def __init__(self, locations: Optional[Dict[str, Path]] = None, jobs: int = 1,
+                 cache_path: Optional[Path] = None, hash_algo: Optional[str] = None,
+                 hash_all: bool = False):
         self.locations = locations or {}
+        self.jobs = max(1, jobs)
+        # run_full_scan only reads files whose name is found in more than
+        # one location unless hash_all is set
+        self.hash_all = hash_all
+        self.hash_algo = hash_algo or DEFAULT_HASH_ALGO
+        if ((self.hash_algo == 'blake3' and blake3 is None) or (self.hash_algo == 'xxh3' and xxhash is None)
+                or self.hash_algo not in HASH_PREFIXES):
+            print(f"Warning: Hash algorithm '{self.hash_algo}' unavailable, using sha256")
+            self.hash_algo = 'sha256'
         self.files: List[FileInfo] = []
         self.scan_errors: List[str] = []
+        # If set, scanned files are also written here, one JSON line each,
+        # as every location completes; with self.files empty it is read back instead
+        self.ndjson_path: Optional[Path] = None
+        # Hashes keyed by path, reused while size and mtime_ns are unchanged
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._hash_cache: Dict[str, CacheEntry] = {}
+        self._load_cache()
+        # Worker pool shared by locations scanned concurrently in run_full_scan
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # One shared str per distinct hash/version, so duplicate files do
+        # not each hold their own copy (dict.setdefault is atomic)
+        self._interned: Dict[str, str] = {}
+
+    def _load_cache(self):
+        """Load the hash cache, starting empty if missing or stale"""
+        self._hash_cache = {}
+        if self.cache_path is None:
+            return
+        try:
+            with open(self.cache_path, 'rb') as f:
+                data = _json_loads(f.read())
+        except FileNotFoundError:
+            return
+        except (IOError, OSError, ValueError) as e:
+            print(f"Warning: Ignoring unreadable hash cache '{self.cache_path}': {e}")
+            return
+
+        if (isinstance(data, dict) and data.get("version") == self.CACHE_VERSION
+                and isinstance(data.get("files"), dict)):
+            self._hash_cache = data["files"]
+
+    def save_cache(self):
+        """Persist the hash cache, keeping the most recently scanned paths"""
+        if self.cache_path is None:
+            return
+        files = self._hash_cache
+        if len(files) > self.CACHE_MAX_ENTRIES:
+            files = dict(list(files.items())[-self.CACHE_MAX_ENTRIES:])
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'wb') as f:
+                f.write(_json_dumps({"version": self.CACHE_VERSION, "files": files}))
+        except (IOError, OSError) as e:
+            print(f"Warning: Could not write hash cache '{self.cache_path}': {e}")
 
     def compute_hash(self, filepath: Path) -> str:
-        """Compute SHA256 hash of file content."""
-        try:
-            hasher = hashlib.sha256()
-            with open(filepath, 'rb') as f:
-                for chunk in iter(lambda: f.read(8192), b''):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except Exception as e:
-            return f"ERROR:{e}"
+        """Compute the prefixed content hash of a file with self.hash_algo."""
+        return _compute_hash(filepath, self.hash_algo)
 
     def extract_version(self, filepath: Path) -> Optional[str]:
         """Extract #property version from MQL5 file."""
+        return _extract_version(filepath)
+
+    def _scan_files(self, paths: List[str], sizes: List[int],
+                    mtimes: List[int]) -> List[Tuple[str, Optional[str]]]:
+        """Hash files in order, fanning out to worker processes for large scans"""
+        cached = [self._hash_cache.get(path) for path in paths]
+        if self.jobs <= 1 or len(paths) < self.PARALLEL_MIN_FILES:
+            return list(map(_hash_and_version, paths, sizes, mtimes, cached, repeat(self.hash_algo)))
+
+        chunksize = max(1, len(paths) // (self.jobs * 4))
+        args = (paths, sizes, mtimes, cached, repeat(self.hash_algo))
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(2000)  # Version is usually near the top
-            match = re.search(r'#property\s+version\s+"([^"]+)"', content)
-            return match.group(1) if match else None
-        except (IOError, OSError):
-            return None
+            if self._process_pool is not None:
+                return list(self._process_pool.map(_hash_and_version, *args, chunksize=chunksize))
+            with ProcessPoolExecutor(max_workers=self.jobs) as executor:
+                return list(executor.map(_hash_and_version, *args, chunksize=chunksize))
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel hashing unavailable, continuing serially: {e}")
+            return list(map(_hash_and_version, paths, sizes, mtimes, cached, repeat(self.hash_algo)))
+
+    def load_records(self, records: List[Dict[str, Any]]):
+        """Set self.files from the "files" records of a saved scan.
+
+        Large scans are split into one contiguous shard per job and
+        converted in worker processes; the shards are concatenated in
+        order, so self.files matches a serial load.
+        """
+        if self.jobs <= 1 or len(records) < self.PARALLEL_MIN_RECORDS:
+            self.files = _file_infos(records)
+            return
+
+        size = -(-len(records) // self.jobs)
+        shards = [records[i:i + size] for i in range(0, len(records), size)]
+        try:
+            with ProcessPoolExecutor(max_workers=len(shards)) as executor:
+                self.files = [f for shard in executor.map(_file_infos, shards) for f in shard]
+        except (OSError, BrokenProcessPool) as e:
+            print(f"Warning: Parallel loading unavailable, continuing serially: {e}")
+            self.files = _file_infos(records)
 
     def scan_location(self, location_name: str, base_path: Path,
                       max_depth: int = 20) -> List[FileInfo]:
         """Recursively scan a location for MQL5 files."""
-        files = []
+        lines, errors = [], []
+        own_pool = self.jobs > 1 and self._process_pool is None
+        if own_pool:
+            # Shared by the batches _scan_location hashes as they are walked
+            self._process_pool = ProcessPoolExecutor(max_workers=self.jobs)
+        try:
+            files = self._scan_location(location_name, base_path, lines, errors)
+        finally:
+            if own_pool:
+                self._process_pool.shutdown()
+                self._process_pool = None
+        if lines:
+            print("\n".join(lines))
+        self.scan_errors.extend(errors)
+        return files
+
+    def _scan_location(self, location_name: str, base_path: Path,
+                       lines: List[str], errors: List[str]) -> List[FileInfo]:
+        """Scan one location for run_full_scan's --hash-all mode.
+
+        Output lines and errors go to the given lists rather than stdout;
+        run_full_scan prints them, and writes the location's NDJSON
+        records, only once every earlier location has been merged.
+        Every file is hashed. Each batch of files is handed to a hashing
+        thread as soon as it is walked, so reading and hashing overlap the
+        walk of the remaining subdirectories instead of waiting for it.
+        """
+        if not self._begin_location(location_name, base_path, lines, errors):
+            return []
+
+        found = []
+        pending = []
+        with ThreadPoolExecutor(max_workers=1) as hasher:
+            try:
+                for batch in self._walk_batches(os.fspath(base_path)):
+                    batch = self._stat_results(location_name, batch, errors)
+                    found.extend(batch)
+                    pending.append(hasher.submit(self._scan_files, [path for path, _ in batch],
+                                                 [stat.st_size for _, stat in batch],
+                                                 [stat.st_mtime_ns for _, stat in batch]))
+            except Exception as e:
+                errors.append(f"{location_name}: Scan failed - {e}")
+        results = (result for future in pending for result in future.result())
+        return self._hash_location(location_name, base_path, found, lines, errors, results=results)
 
+    @staticmethod
+    def _begin_location(location_name: str, base_path: Path, lines: List[str], errors: List[str]) -> bool:
+        """Announce a location about to be scanned; False (with the error
+        recorded) if it does not exist"""
         if not base_path.exists():
-            self.scan_errors.append(f"{location_name}: Path not found - {base_path}")
-            return files
+            errors.append(f"{location_name}: Path not found - {base_path}")
+            return False
+        lines.append(f"  Scanning {location_name}: {base_path}")
+        return True
+
+    def _walk_batches(self, base: str) -> Iterator[List[FoundFile]]:
+        """Walk a location, yielding the files of its top directory and
+        then those of each top-level subdirectory, in order, as each is
+        walked"""
+        # One walk collects every extension with its stat result. Each
+        # top-level subdirectory is walked on its own thread, since
+        # readdir round-trips (not bandwidth) dominate on /mnt/c
+        walked: List[FoundFile] = []
+        subdirs: List[str] = []
+        _scan_dir(base, self.MQL5_EXTENSIONS, walked, subdirs)
+        yield walked
+        if len(subdirs) < self.PARALLEL_MIN_DIRS:
+            for d in subdirs:
+                yield _walk_subdir(d, self.MQL5_EXTENSIONS)
+        else:
+            with ThreadPoolExecutor(max_workers=min(16, len(subdirs))) as executor:
+                yield from executor.map(_walk_subdir, subdirs, repeat(self.MQL5_EXTENSIONS))
+
+    @staticmethod
+    def _stat_results(location_name: str, walked: List[FoundFile],
+                      errors: List[str]) -> List[Tuple[str, os.stat_result]]:
+        """Walked files that could be stat()ed; the rest are reported in errors"""
+        found = []
+        for path, stat in walked:
+            if isinstance(stat, OSError):
+                errors.append(f"{location_name}: Error scanning {path} - {stat}")
+            else:
+                found.append((path, stat))
+        return found
+
+    def _walk_location(self, location_name: str, base_path: Path, lines: List[str],
+                       errors: List[str]) -> Optional[List[Tuple[str, os.stat_result]]]:
+        """(path, stat) of every MQL5 file in a location, or None if the
+        location does not exist"""
+        if not self._begin_location(location_name, base_path, lines, errors):
+            return None
 
-        print(f"  Scanning {location_name}: {base_path}")
+        found = []
+        try:
+            for batch in self._walk_batches(os.fspath(base_path)):
+                found.extend(self._stat_results(location_name, batch, errors))
+        except Exception as e:
+            errors.append(f"{location_name}: Scan failed - {e}")
+        return found
+
+    def _hash_location(self, location_name: str, base_path: Path, found: List[Tuple[str, os.stat_result]],
+                       lines: List[str], errors: List[str], names: Optional[set] = None,
+                       results: Optional[Iterable[Tuple[str, Optional[str]]]] = None) -> List[FileInfo]:
+        """FileInfo for each file walked in a location.
+
+        If names is given, only files with one of those names are read;
+        the others keep a still-valid cached hash and version, or are
+        left unhashed (''). results, if given, are the (hash, version)
+        of every file, already computed.
+        """
+        files = []
+        location_name = sys.intern(location_name)
+        intern = self._interned.setdefault
 
+        base = os.fspath(base_path)
         try:
-            for ext in self.MQL5_EXTENSIONS:
-                for filepath in base_path.rglob(f"*{ext}"):
-                    try:
-                        stat = filepath.stat()
-                        relative = str(filepath.relative_to(base_path))
-
-                        file_info = FileInfo(
-                            path=str(filepath),
-                            relative_path=relative,
-                            location=location_name,
-                            hash=self.compute_hash(filepath),
-                            size=stat.st_size,
-                            modified=datetime.fromtimestamp(stat.st_mtime).isoformat(),
-                            version=self.extract_version(filepath)
-                        )
-                        files.append(file_info)
-                    except Exception as e:
-                        self.scan_errors.append(f"{location_name}: Error scanning {filepath} - {e}")
+            paths = [path for path, _ in found]
+            sizes = [stat.st_size for _, stat in found]
+            mtimes = [stat.st_mtime_ns for _, stat in found]
+            filenames = [os.path.basename(path) for path in paths]
+            if results is None:
+                if names is None:
+                    results = self._scan_files(paths, sizes, mtimes)
+                else:
+                    results = self._scan_named(paths, sizes, mtimes, filenames, names)
+
+            for (path, stat), filename, (file_hash, version) in zip(found, filenames, results):
+                # Re-inserted so the most recently scanned paths survive trimming
+                self._hash_cache.pop(path, None)
+                if file_hash and not file_hash.startswith('ERROR'):
+                    self._hash_cache[path] = (stat.st_size, stat.st_mtime_ns, file_hash, version)
+                file_hash = intern(file_hash, file_hash)
+                if version is not None:
+                    version = intern(version, version)
+                files.append(FileInfo(
+                    path=path,
+                    relative_path=path[len(base):].lstrip(os.sep),
+                    location=location_name,
+                    hash=file_hash,
+                    size=stat.st_size,
+                    modified=stat.st_mtime_ns,
+                    version=version,
+                    filename=filename
+                ))
         except Exception as e:
-            self.scan_errors.append(f"{location_name}: Scan failed - {e}")
+            errors.append(f"{location_name}: Scan failed - {e}")
 
-        print(f"    Found {len(files)} MQL5 files")
+        lines.append(f"    Found {len(files)} MQL5 files")
         return files
 
+    def _scan_named(self, paths: List[str], sizes: List[int], mtimes: List[int], filenames: List[str],
+                    names: set) -> List[Tuple[str, Optional[str]]]:
+        """(hash, version) per file, reading only the files named in names.
+
+        Other files keep a still-valid cached hash and version, or are
+        left unhashed ('').
+        """
+        results = []
+        wanted = []
+        for i, (path, size, mtime_ns) in enumerate(zip(paths, sizes, mtimes)):
+            cached = self._hash_cache.get(path)
+            if filenames[i] in names:
+                wanted.append(i)
+            elif _cache_valid(cached, size, mtime_ns, self.hash_algo):
+                results.append((cached[2], cached[3]))
+                continue
+            results.append(('', None))
+        hashed = self._scan_files([paths[i] for i in wanted], [sizes[i] for i in wanted],
+                                  [mtimes[i] for i in wanted])
+        for i, result in zip(wanted, hashed):
+            results[i] = result
+        return results
+
     def discover_mt5_terminals(self) -> Dict[str, Path]:
         """Discover all MT5 terminal directories."""
         terminals = {}
 
-        if not self.MT5_TERMINAL_BASE.exists():
+        terminal_base = self.get_mt5_terminal_base()
+        if not terminal_base.exists():
             return terminals
 
         try:
-            for i, terminal_dir in enumerate(self.MT5_TERMINAL_BASE.iterdir(), 1):
+            for i, terminal_dir in enumerate(terminal_base.iterdir(), 1):
                 if terminal_dir.is_dir():
                     mql5_path = terminal_dir / 'MQL5'
                     if mql5_path.exists():
@@ -193,40 +657,125 @@ class MultiLocationScanner:
 
         # Scan GitHub repo (always)
         github_path = self.locations.get('github', self.DEFAULT_LOCATIONS['github'])
-        self.files.extend(self.scan_location('github', github_path))
+        scan_targets = [('github', github_path)]
 
         # Scan DevCentre locations
         for name in ['devcentre', 'devcentre_alt']:
             path = self.locations.get(name, self.DEFAULT_LOCATIONS.get(name))
             if path and path.exists():
-                self.files.extend(self.scan_location(name, path))
+                scan_targets.append((name, path))
 
         # Scan MT5 terminals
         if include_terminals:
-            terminals = self.discover_mt5_terminals()
-            for name, path in terminals.items():
-                self.files.extend(self.scan_location(name, path))
+            scan_targets.extend(self.discover_mt5_terminals().items())
+
+        # One thread per location. With --hash-all each thread walks and
+        # hashes its own location; otherwise every location is walked
+        # first, since which files need reading depends on the names seen
+        # across all of them. Large batches are hashed in a single process
+        # pool shared by all locations (self._process_pool), not one pool
+        # per location.
+        outputs = [([], []) for _ in scan_targets]
+        if self.jobs > 1:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.jobs)
+        ndjson = open(self.ndjson_path, 'wb') if self.ndjson_path else None
+        try:
+            with ThreadPoolExecutor(max_workers=len(scan_targets)) as executor:
+                futures = []
+                if self.hash_all:
+                    # Each location is hashed as it is walked
+                    for (name, path), (lines, errors) in zip(scan_targets, outputs):
+                        futures.append((lines, errors, executor.submit(self._scan_location, name, path,
+                                                                       lines, errors)))
+                else:
+                    walked = list(executor.map(self._walk_location, [name for name, _ in scan_targets],
+                                               [path for _, path in scan_targets],
+                                               [lines for lines, _ in outputs], [errors for _, errors in outputs]))
+
+                    # Only a name found in two or more locations can form a
+                    # duplicate group, so only those files need their content read
+                    name_locations: Dict[str, set] = defaultdict(set)
+                    for (name, _), found in zip(scan_targets, walked):
+                        for path, _ in found or ():
+                            name_locations[os.path.basename(path)].add(name)
+                    names = {filename for filename, locations in name_locations.items() if len(locations) > 1}
+
+                    for (name, path), (lines, errors), found in zip(scan_targets, outputs, walked):
+                        if found is not None:
+                            future = executor.submit(self._hash_location, name, path, found, lines, errors, names)
+                        else:
+                            future = None
+                        futures.append((lines, errors, future))
+
+                # Merged while later locations are still being scanned, in
+                # location order so the output (and the NDJSON a
+                # --stream-analyze report is built from) does not depend on
+                # which location finishes first
+                for lines, errors, future in futures:
+                    files = future.result() if future is not None else []
+                    if lines:
+                        print("\n".join(lines))
+                    self.scan_errors.extend(errors)
+                    self.files.extend(files)
+                    if ndjson is not None:
+                        ndjson.writelines(_json_dumps(file_info) + b'\n' for file_info in files)
+                        ndjson.flush()
+        finally:
+            if ndjson is not None:
+                ndjson.close()
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+
+        self.save_cache()
 
         print()
         print(f"Total files scanned: {len(self.files)}")
 
         return self.generate_report()
 
-    def find_duplicates_by_name(self) -> Dict[str, DuplicateGroup]:
-        """Find files with the same filename across different locations."""
-        by_filename: Dict[str, List[FileInfo]] = defaultdict(list)
+    def _iter_files(self) -> Iterable[FileInfo]:
+        """Scanned files: self.files, or streamed from self.ndjson_path if
+        the files were not loaded into memory"""
+        if self.files or self.ndjson_path is None:
+            return self.files
+        return _iter_ndjson(self.ndjson_path)
+
+    def _analyze(self) -> Tuple[Dict[str, DuplicateGroup], List[DuplicateGroup], List[FileInfo],
+                                List[FileInfo], Dict[str, int]]:
+        """Run every analysis in one pass over the scanned files.
 
-        for f in self.files:
-            filename = Path(f.path).name
-            by_filename[filename].append(f)
+        Returns (duplicates by name, hash conflicts, files missing in
+        GitHub, GitHub-only files, file count per location).
+        """
+        by_filename: Dict[str, List[FileInfo]] = defaultdict(list)
+        files_per_location: Dict[str, int] = {}
+        github_names, other_names = set(), set()
+        github_files, other_files = [], []
+
+        # The hot loop runs once per file: attributes are read once and
+        # the container methods are bound to locals
+        count = files_per_location.get
+        add_github, add_other = github_names.add, other_names.add
+        append_github, append_other = github_files.append, other_files.append
+        for f in self._iter_files():
+            name, location = f.filename, f.location
+            by_filename[name].append(f)
+            files_per_location[location] = count(location, 0) + 1
+            if location == 'github':
+                add_github(name)
+                append_github(f)
+            else:
+                add_other(name)
+                append_other(f)
 
         duplicates = {}
         for filename, file_list in by_filename.items():
             if len(file_list) > 1:
                 # Check if from different locations
-                locations = set(f.location for f in file_list)
+                locations = {f.location for f in file_list}
                 if len(locations) > 1:
-                    unique_hashes = len(set(f.hash for f in file_list if not f.hash.startswith('ERROR')))
+                    unique_hashes = len({f.hash for f in file_list if f.hash and not f.hash.startswith('ERROR')})
                     duplicates[filename] = DuplicateGroup(
                         filename=filename,
                         files=file_list,
@@ -234,41 +783,37 @@ class MultiLocationScanner:
                         unique_hashes=unique_hashes
                     )
 
-        return duplicates
+        conflicts = [d for d in duplicates.values() if not d.hash_match]
+        missing_in_github = [f for f in other_files if f.filename not in github_names]
+        github_only = [f for f in github_files if f.filename not in other_names]
+        return duplicates, conflicts, missing_in_github, github_only, files_per_location
+
+    def find_duplicates_by_name(self) -> Dict[str, DuplicateGroup]:
+        """Find files with the same filename across different locations."""
+        return self._analyze()[0]
 
     def find_hash_conflicts(self) -> List[DuplicateGroup]:
         """Find files with same name but different content."""
-        duplicates = self.find_duplicates_by_name()
-        return [d for d in duplicates.values() if not d.hash_match]
+        return self._analyze()[1]
 
     def find_missing_in_github(self) -> List[FileInfo]:
         """Find files that exist elsewhere but not in GitHub."""
-        github_files = {Path(f.relative_path).name for f in self.files if f.location == 'github'}
-        return [f for f in self.files if f.location != 'github' and Path(f.path).name not in github_files]
+        return self._analyze()[2]
 
     def find_github_only(self) -> List[FileInfo]:
         """Find files that only exist in GitHub."""
-        non_github_files = {Path(f.path).name for f in self.files if f.location != 'github'}
-        return [f for f in self.files if f.location == 'github' and Path(f.path).name not in non_github_files]
+        return self._analyze()[3]
 
     def generate_report(self) -> Dict[str, Any]:
         """Generate comprehensive analysis report."""
-        duplicates = self.find_duplicates_by_name()
-        conflicts = self.find_hash_conflicts()
-        missing_in_github = self.find_missing_in_github()
-        github_only = self.find_github_only()
-
-        # Group files by location
-        by_location = defaultdict(list)
-        for f in self.files:
-            by_location[f.location].append(f)
+        duplicates, conflicts, missing_in_github, github_only, files_per_location = self._analyze()
 
         report = {
             "scan_timestamp": datetime.now().isoformat(),
             "summary": {
-                "total_files": len(self.files),
-                "locations_scanned": len(by_location),
-                "files_per_location": {loc: len(files) for loc, files in by_location.items()},
+                "total_files": sum(files_per_location.values()),
+                "locations_scanned": len(files_per_location),
+                "files_per_location": files_per_location,
                 "duplicate_filenames": len(duplicates),
                 "hash_conflicts": len(conflicts),
                 "missing_in_github": len(missing_in_github),
@@ -285,7 +830,7 @@ class MultiLocationScanner:
                             "path": f.relative_path,
                             "hash": f.hash[:16] + "...",
                             "size": f.size,
-                            "modified": f.modified,
+                            "modified": _format_modified(f.modified),
                             "version": f.version
                         }
                         for f in c.files
@@ -295,21 +840,20 @@ class MultiLocationScanner:
             ],
             "missing_in_github": [
                 {
-                    "filename": Path(f.path).name,
+                    "filename": f.filename,
                     "location": f.location,
                     "path": f.relative_path,
-                    "hash": f.hash[:16] + "..." if not f.hash.startswith('ERROR') else f.hash
+                    "hash": f.hash[:16] + "..." if f.hash and not f.hash.startswith('ERROR') else f.hash
                 }
                 for f in missing_in_github[:50]  # Limit output
             ],
             "github_only": [
                 {
-                    "filename": Path(f.path).name,
+                    "filename": f.filename,
                     "path": f.relative_path
                 }
                 for f in github_only
             ],
-            "all_files": [asdict(f) for f in self.files],
             "scan_errors": self.scan_errors
         }
 
@@ -396,9 +940,20 @@ class MultiLocationScanner:
             print("   - Check permissions and path existence")
 
     def save_report(self, report: Dict[str, Any], output_path: Path):
-        """Save report to JSON file."""
-        with open(output_path, 'w') as f:
-            json.dump(report, f, indent=2)
+        """Save report to JSON file.
+
+        The scanned files are streamed into an "all_files" list after the
+        report's own keys, one object per line, rather than being copied
+        into the report dict first.
+        """
+        with open(output_path, 'wb') as f:
+            head = _json_dumps(report, indent=True)
+            f.write(head[:-2] + b',\n  "all_files": [' if report else b'{\n  "all_files": [')
+            separator = b'\n    '
+            for file_info in self._iter_files():
+                f.write(separator + _json_dumps(file_info))
+                separator = b',\n    '
+            f.write(b']\n}' if separator == b'\n    ' else b'\n  ]\n}')
         print(f"\nReport saved to: {output_path}")
 
 
@@ -513,8 +1068,25 @@ def main():
                         help="Generate PowerShell script for Windows scanning")
     parser.add_argument("--analyze", type=str, metavar="JSON_FILE",
                         help="Analyze results from Windows scan")
+    parser.add_argument("--stream-analyze", type=str, metavar="NDJSON_FILE",
+                        help="Analyze a scan's per-file NDJSON without loading it into memory")
+    parser.add_argument("--ndjson", action="store_true",
+                        help="Also write each scanned file to <output>.ndjson as its location completes "
+                             "(for --stream-analyze)")
     parser.add_argument("--output", type=str, default="scan_report.json",
                         help="Output file for scan results")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for hashing large scans and loading large --analyze input "
+                             "(default: CPU count, 1 = serial)")
+    parser.add_argument("--cache-file", type=str,
+                        help="Hash cache reused for unchanged files "
+                             f"(default: {MultiLocationScanner.DEFAULT_CACHE_PATH})")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Hash every file and do not read or write the hash cache")
+    parser.add_argument("--hash-all", action="store_true",
+                        help="Hash every file, not only those whose name is found in more than one location")
+    parser.add_argument("--crypto", action="store_true",
+                        help="Hash with SHA256 instead of the fastest installed hash (BLAKE3/xxh3)")
 
     args = parser.parse_args()
 
@@ -531,39 +1103,46 @@ def main():
     if args.analyze:
         # Load and analyze Windows scan results
         print(f"Analyzing: {args.analyze}")
-        with open(args.analyze, 'r') as f:
-            windows_data = json.load(f)
+        with open(args.analyze, 'rb') as f:
+            windows_data = _json_loads(f.read())
 
         # Convert to FileInfo objects
-        scanner = MultiLocationScanner()
-        scanner.files = [
-            FileInfo(
-                path=f['path'],
-                relative_path=f['relative_path'],
-                location=f['location'],
-                hash=f['hash'],
-                size=f['size'],
-                modified=f['modified'],
-                version=f.get('version')
-            )
-            for f in windows_data.get('files', [])
-        ]
+        scanner = MultiLocationScanner(jobs=args.jobs)
+        scanner.load_records(windows_data.get('files', []))
 
         report = scanner.generate_report()
         scanner.print_report(report)
         scanner.save_report(report, Path(args.output))
         return 0
 
+    if args.stream_analyze:
+        print(f"Analyzing: {args.stream_analyze}")
+        scanner = MultiLocationScanner()
+        scanner.ndjson_path = Path(args.stream_analyze)
+        report = scanner.generate_report()
+        scanner.print_report(report)
+        scanner.save_report(report, Path(args.output))
+        return 0
+
     # Default: scan accessible locations
-    scanner = MultiLocationScanner()
+    if args.no_cache:
+        cache_path = None
+    else:
+        cache_path = Path(args.cache_file) if args.cache_file else MultiLocationScanner.DEFAULT_CACHE_PATH
+    scanner = MultiLocationScanner(jobs=args.jobs, cache_path=cache_path,
+                                   hash_algo='sha256' if args.crypto else None, hash_all=args.hash_all)
 
     if args.github_only:
         scanner.files = scanner.scan_location(
             'github',
             Path(__file__).parent.parent / 'MQL5'
         )
+        scanner.save_cache()
         report = scanner.generate_report()
     else:
+        if args.ndjson:
+            # Kept after the scan, and holds every completed location if it is interrupted
+            scanner.ndjson_path = Path(args.output + '.ndjson')
         report = scanner.run_full_scan(include_terminals=args.all)
 
     scanner.print_report(report)
@@ -14,17 +14,151 @@ Version: 1.216
 """
 
 import os
+import mmap
+import stat
+import atexit
 import shutil
 import hashlib
 import json
 import subprocess
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Sequence, Tuple, Optional, Any, Callable
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import blake3  # Optional: fast change detection
+except ImportError:
+    blake3 = None
+
+try:
+    import xxhash  # Optional: fast change detection (xxh3-128)
+except ImportError:
+    xxhash = None
+
+try:
+    import orjson  # Optional: faster writing of the sync manifest
+except ImportError:
+    orjson = None
+
+try:
+    from cryptography.hazmat.primitives import hashes as crypto_hashes  # Optional: OpenSSL SHA256
+except ImportError:
+    crypto_hashes = None
+
+# Files are hashed in chunks of this size, so the per-chunk Python overhead
+# is small next to the hashing itself
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Larger files are hashed through a read-only mmap in one update() call;
+# smaller ones with a single read()
+MMAP_MIN_SIZE = 64 * 1024
+# Files compared byte by byte are checked in tiles of this size, stopping at the first difference
+COMPARE_TILE_SIZE = 4 * 1024 * 1024
+
+
+class _CryptographySHA256:
+    """hashlib-style SHA256 on top of the cryptography package's OpenSSL"""
+
+    def __init__(self):
+        self._hash = crypto_hashes.Hash(crypto_hashes.SHA256())
+
+    def update(self, data):
+        self._hash.update(data)
+
+    def hexdigest(self) -> str:
+        return self._hash.finalize().hex()
+
+
+def _select_sha256():
+    """Return the SHA256 constructor most likely to use the CPU's SHA extensions.
+
+    OpenSSL dispatches SHA256 to SHA-NI (or ARMv8 SHA2) at runtime, so
+    hashlib's OpenSSL-backed sha256 is used when available. Python builds
+    without OpenSSL fall back to a portable C implementation; there the
+    cryptography package's bundled OpenSSL is used instead, if installed.
+    """
+    if getattr(hashlib.sha256, '__name__', '') == 'openssl_sha256' or crypto_hashes is None:
+        return hashlib.sha256
+    return _CryptographySHA256
+
+
+# Chosen once at import, used for every SHA256 computed here
+_sha256_new = _select_sha256()
+
+
+class HashCache:
+    """Persistent file hashes, reused while a file's size, mtime_ns and inode are unchanged"""
+
+    VERSION = 1
+    # Outside the work tree, so the cache never shows up in git status
+    DEFAULT_PATH = Path.home() / '.cache' / 'velocitytrader' / 'sync_hash_cache.json'
+
+    def __init__(self):
+        self.path: Optional[Path] = None
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        self._save_registered = False
+
+    def open(self, path: Path):
+        """Load the cache from path (starting empty if missing or stale) and save it back at exit"""
+        if path == self.path:
+            return
+        self.path = path
+        self.entries = {}
+        self.dirty = False
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and data.get("version") == self.VERSION and isinstance(data.get("files"), dict):
+                self.entries = data["files"]
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Ignoring unreadable hash cache {path}: {e}")
+        if not self._save_registered:
+            atexit.register(self.save)
+            self._save_registered = True
+
+    def lookup(self, file_path: Path, algo: str) -> Tuple[Optional[Tuple[int, int, int]], Optional[str]]:
+        """Return (stat key, cached digest or None); the key is None if the cache is closed or stat() fails"""
+        if self.path is None:
+            return None, None
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None, None
+        key = (st.st_size, st.st_mtime_ns, st.st_ino)
+        entry = self.entries.get(str(file_path))
+        if entry is not None and tuple(entry[:3]) == key and entry[3] == algo:
+            return key, entry[4]
+        return key, None
+
+    def store(self, file_path: Path, algo: str, key: Tuple[int, int, int], digest: str):
+        """Remember the digest of a file for the given stat key"""
+        self.entries[str(file_path)] = [*key, algo, digest]
+        self.dirty = True
+
+    def save(self):
+        """Write the cache back atomically if anything changed"""
+        if self.path is None or not self.dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({"version": self.VERSION, "files": self.entries}, f)
+            os.replace(tmp_path, self.path)
+            self.dirty = False
+        except OSError as e:
+            print(f"⚠️  Could not save hash cache {self.path}: {e}")
 
 
 class FileHashManager:
     """Manages file hashing for sync verification"""
+
+    # Shared by every hash computed in this process, see ProjectQuantumSyncManager
+    cache = HashCache()
     
     @staticmethod
     def compute_hash(file_path: Path) -> Optional[str]:
@@ -36,6 +170,67 @@ class FileHashManager:
         Returns:
             Hex string of SHA256 hash, or None if file doesn't exist or cannot be read
         """
+        return FileHashManager._hash_file(file_path, _sha256_new(), 'sha256')
+
+    @staticmethod
+    def fast_hash(file_path: Path) -> Optional[str]:
+        """Compute a fast, non-cryptographic content hash for change detection.
+
+        Uses BLAKE3 or xxh3-128 when installed, otherwise SHA256. The digest
+        is only meaningful for comparing files hashed in the same run.
+
+        Args:
+            file_path: Path to the file to hash
+
+        Returns:
+            Hex string of the hash, or None if file doesn't exist or cannot be read
+        """
+        if blake3 is not None:
+            hasher, algo = blake3.blake3(), 'blake3'
+        elif xxhash is not None:
+            hasher, algo = xxhash.xxh3_128(), 'xxh3'
+        else:
+            hasher, algo = _sha256_new(), 'sha256'
+        return FileHashManager._hash_file(file_path, hasher, algo)
+
+    @staticmethod
+    def stat_signature(file_path: Path) -> Optional[Tuple[int, int]]:
+        """Return (size, mtime_ns) of a regular file, or None if it is not one or cannot be stat()ed"""
+        try:
+            st = file_path.stat()
+        except OSError:
+            return None
+        return FileHashManager.signature_of(st)
+
+    @staticmethod
+    def signature_of(st: Optional[os.stat_result]) -> Optional[Tuple[int, int]]:
+        """stat_signature from an existing stat() result"""
+        if st is None or not stat.S_ISREG(st.st_mode):
+            return None
+        return st.st_size, st.st_mtime_ns
+
+    @staticmethod
+    def signatures_match(sig1: Optional[Tuple[int, int]], sig2: Optional[Tuple[int, int]]) -> Optional[bool]:
+        """Compare two stat signatures without reading either file.
+
+        Returns:
+            False if the sizes differ, True if size and mtime_ns are both equal
+            (shutil.copy2 preserves mtime), None if the contents must be hashed.
+        """
+        if sig1 is None or sig2 is None:
+            return None
+        if sig1[0] != sig2[0]:
+            return False
+        if sig1[1] == sig2[1]:
+            return True
+        return None
+
+    @staticmethod
+    def _hash_file(file_path: Path, hasher, algo: str) -> Optional[str]:
+        """Feed a file's content to hasher, returning its hex digest or None.
+
+        Digests are served from and added to FileHashManager.cache.
+        """
         if not file_path.exists():
             return None
 
@@ -43,12 +238,20 @@ class FileHashManager:
             print(f"⚠️  Cannot hash non-file: {file_path}")
             return None
 
-        hasher = hashlib.sha256()
+        key, digest = FileHashManager.cache.lookup(file_path, algo)
+        if digest is not None:
+            return digest
+
         try:
-            with open(file_path, 'rb') as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
+            fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+            try:
+                FileHashManager._hash_fd(fd, os.fstat(fd).st_size, hasher)
+            finally:
+                os.close(fd)
+            digest = hasher.hexdigest()
+            if key is not None:
+                FileHashManager.cache.store(file_path, algo, key, digest)
+            return digest
         except PermissionError:
             print(f"⚠️  Permission denied reading file for hash: {file_path}")
             return None
@@ -59,9 +262,29 @@ class FileHashManager:
             print(f"⚠️  Unexpected error computing hash for {file_path}: {e}")
             return None
     
+    @staticmethod
+    def _hash_fd(fd: int, size: int, hasher):
+        """Feed an open file to hasher with as few Python-level calls as possible"""
+        if size > MMAP_MIN_SIZE:
+            try:
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mm, 'madvise'):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mm)
+                return
+            except (OSError, ValueError):
+                pass  # Not mappable (e.g. some network/drvfs mounts): read in chunks
+            for chunk in iter(lambda: os.read(fd, HASH_CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        else:
+            hasher.update(os.read(fd, size))
+
     @staticmethod
     def files_are_identical(file1: Path, file2: Path) -> bool:
-        """Check if two files are identical using hash comparison.
+        """Check if two files are identical, hashing only when stat() cannot tell.
+
+        Files of different sizes differ; files with the same size and
+        mtime_ns are taken as identical; otherwise the contents are hashed.
 
         Args:
             file1: Path to the first file
@@ -76,35 +299,79 @@ class FileHashManager:
         if not file2.exists():
             return False
 
-        hash1 = FileHashManager.compute_hash(file1)
-        hash2 = FileHashManager.compute_hash(file2)
+        match = FileHashManager.signatures_match(FileHashManager.stat_signature(file1),
+                                                 FileHashManager.stat_signature(file2))
+        if match is not None:
+            return match
 
-        # If either hash computation failed, files are not identical
-        if hash1 is None or hash2 is None:
-            return False
+        # If either file cannot be read, files are not identical
+        return bool(FileHashManager.contents_equal(file1, file2))
 
-        return hash1 == hash2
+    @staticmethod
+    def contents_equal(file1: Path, file2: Path) -> Optional[bool]:
+        """Compare two files byte by byte, stopping at the first differing tile.
+
+        Cheaper than hashing both: each file is read at most once and
+        usually only up to the first difference.
+
+        Returns:
+            True if the contents are equal, False if they differ, None if either file cannot be read
+        """
+        try:
+            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
+                size = os.fstat(f1.fileno()).st_size
+                if os.fstat(f2.fileno()).st_size != size:
+                    return False
+                if size <= MMAP_MIN_SIZE:
+                    return f1.read() == f2.read()
+                try:
+                    with mmap.mmap(f1.fileno(), 0, access=mmap.ACCESS_READ) as mm1, \
+                            mmap.mmap(f2.fileno(), 0, access=mmap.ACCESS_READ) as mm2:
+                        for offset in range(0, size, COMPARE_TILE_SIZE):
+                            end = offset + COMPARE_TILE_SIZE
+                            if mm1[offset:end] != mm2[offset:end]:
+                                return False
+                        return True
+                except (OSError, ValueError):
+                    pass  # Not mappable (e.g. some network/drvfs mounts): read in tiles
+                while True:
+                    tile = f1.read(COMPARE_TILE_SIZE)
+                    if tile != f2.read(COMPARE_TILE_SIZE):
+                        return False
+                    if not tile:
+                        return True
+        except OSError as e:
+            print(f"⚠️  Cannot compare {file1} with {file2}: {e}")
+            return None
 
 
 class MT5SyncEngine:
     """Core synchronization engine for MT5 files"""
     
+    # Files of one batch synced at the same time
+    MAX_FILE_WORKERS = 8
+
     def __init__(self, dev_dir: Path, mt5_terminals: List[Path]):
         self.dev_dir = dev_dir
         self.mt5_terminals = mt5_terminals
         self.sync_manifest = {}
     
-    def sync_file(self, src_path: Path, dst_path: Path, create_backup: bool = True) -> Dict[str, Any]:
+    def sync_file(self, src_path: Path, dst_path: Path, create_backup: bool = True,
+                  log: Optional[List[str]] = None, created_dirs: Optional[set] = None) -> Dict[str, Any]:
         """Sync a single file with hash comparison.
 
         Args:
             src_path: Source file path
             dst_path: Destination file path
             create_backup: Whether to create a backup of existing destination file
+            log: If given, progress lines are appended here instead of printed
+            created_dirs: Directories known to exist, shared across a batch; the
+                destination directory is only created if it is not in it, and added once created
 
         Returns:
             Dictionary with sync result containing success, action, error, and backup_created fields
         """
+        out: Callable[[str], None] = print if log is None else log.append
         result = {
             "success": False,
             "action": "none",
@@ -112,79 +379,199 @@ class MT5SyncEngine:
             "backup_created": False
         }
 
-        # Validate source file exists and is readable
-        if not src_path.exists():
+        # Validate source file exists and is readable (one stat() for both checks,
+        # reused for the comparison below)
+        try:
+            src_stat = src_path.stat()
+        except OSError:
             result["error"] = f"Source file does not exist: {src_path}"
-            print(f"  ❌ Error: Source not found - {src_path.name}")
+            out(f"  ❌ Error: Source not found - {src_path.name}")
             return result
 
-        if not src_path.is_file():
+        if not stat.S_ISREG(src_stat.st_mode):
             result["error"] = f"Source is not a file: {src_path}"
-            print(f"  ❌ Error: Source is not a file - {src_path.name}")
+            out(f"  ❌ Error: Source is not a file - {src_path.name}")
             return result
 
-        try:
-            # Create destination directory if needed
-            dst_path.parent.mkdir(parents=True, exist_ok=True)
-        except PermissionError:
-            result["error"] = f"Permission denied creating directory: {dst_path.parent}"
-            print(f"  ❌ Error: Permission denied for directory - {dst_path.parent}")
-            return result
-        except OSError as e:
-            result["error"] = f"Cannot create directory {dst_path.parent}: {e}"
-            print(f"  ❌ Error: Cannot create directory - {e}")
+        if not self._ensure_parent_dir(dst_path, result, out, created_dirs):
             return result
 
         try:
             # Check if files are different
-            if FileHashManager.files_are_identical(src_path, dst_path):
+            if self._is_unchanged(src_path, src_stat, dst_path):
                 result["action"] = "unchanged"
                 result["success"] = True
-                print(f"  ✓ Unchanged: {src_path.name}")
+                out(f"  ✓ Unchanged: {src_path.name}")
                 return result
 
             # Create backup if destination exists and backup is requested
             if create_backup and dst_path.exists():
-                backup_path = dst_path.with_suffix(dst_path.suffix + '.backup')
-                try:
-                    shutil.copy2(dst_path, backup_path)
-                    result["backup_created"] = True
-                    print(f"  📋 Backup: {dst_path.name} -> {backup_path.name}")
-                except PermissionError:
-                    print(f"  ⚠️  Warning: Cannot create backup (permission denied): {backup_path}")
-                except shutil.Error as e:
-                    print(f"  ⚠️  Warning: Backup failed: {e}")
+                result["backup_created"] = self._backup_file(dst_path, out)
 
             # Copy file
-            shutil.copy2(src_path, dst_path)
+            self._fast_copy(src_path, dst_path)
             result["action"] = "synced"
             result["success"] = True
-            print(f"  ✅ Synced: {src_path.name}")
+            out(f"  ✅ Synced: {src_path.name}")
 
         except PermissionError:
             result["error"] = f"Permission denied copying file: {src_path} -> {dst_path}"
-            print(f"  ❌ Error: Permission denied - {src_path.name}")
+            out(f"  ❌ Error: Permission denied - {src_path.name}")
         except shutil.Error as e:
             result["error"] = f"Copy error: {e}"
-            print(f"  ❌ Error: Copy failed - {src_path.name}: {e}")
+            out(f"  ❌ Error: Copy failed - {src_path.name}: {e}")
         except IOError as e:
             result["error"] = f"I/O error: {e}"
-            print(f"  ❌ Error: I/O error - {src_path.name}: {e}")
+            out(f"  ❌ Error: I/O error - {src_path.name}: {e}")
         except Exception as e:
             result["error"] = f"Unexpected error: {e}"
-            print(f"  ❌ Error: {src_path.name} - {e}")
+            out(f"  ❌ Error: {src_path.name} - {e}")
 
         return result
     
+    @staticmethod
+    def _ensure_parent_dir(dst_path: Path, result: Dict[str, Any], out: Callable[[str], None],
+                           created_dirs: Optional[set]) -> bool:
+        """Create dst_path's directory unless created_dirs already has it.
+
+        On failure the error is recorded in result and False is returned.
+        """
+        if created_dirs is not None and dst_path.parent in created_dirs:
+            return True
+        try:
+            dst_path.parent.mkdir(parents=True, exist_ok=True)
+        except PermissionError:
+            result["error"] = f"Permission denied creating directory: {dst_path.parent}"
+            out(f"  ❌ Error: Permission denied for directory - {dst_path.parent}")
+            return False
+        except OSError as e:
+            result["error"] = f"Cannot create directory {dst_path.parent}: {e}"
+            out(f"  ❌ Error: Cannot create directory - {e}")
+            return False
+        if created_dirs is not None:
+            created_dirs.add(dst_path.parent)
+        return True
+
+    @staticmethod
+    def _is_unchanged(src_path: Path, src_stat: os.stat_result, dst_path: Path) -> bool:
+        """Whether dst already matches src - from stat() where possible,
+        otherwise by comparing the bytes (a missing or unreadable dst is not)"""
+        try:
+            dst_stat = dst_path.stat()
+        except OSError:
+            return False
+        identical = FileHashManager.signatures_match(FileHashManager.signature_of(src_stat),
+                                                     FileHashManager.signature_of(dst_stat))
+        if identical is None:
+            identical = bool(FileHashManager.contents_equal(src_path, dst_path))
+        return identical
+
+    @staticmethod
+    def _backup_file(dst_path: Path, out: Callable[[str], None]) -> bool:
+        """Copy dst_path to <name>.backup; a failed backup is only a warning"""
+        backup_path = dst_path.with_suffix(dst_path.suffix + '.backup')
+        try:
+            shutil.copy2(dst_path, backup_path)
+        except PermissionError:
+            out(f"  ⚠️  Warning: Cannot create backup (permission denied): {backup_path}")
+            return False
+        except shutil.Error as e:
+            out(f"  ⚠️  Warning: Backup failed: {e}")
+            return False
+        out(f"  📋 Backup: {dst_path.name} -> {backup_path.name}")
+        return True
+
+    @staticmethod
+    def snapshot_files(root: Path, rel_paths: Sequence[str]) -> Dict[str, Optional[os.stat_result]]:
+        """stat() results for rel_paths under root, or None for those that do not exist.
+
+        Each parent directory is listed once with os.scandir and the files
+        are looked up in the listing (on Windows the listing already
+        carries the stat data). A name missing from a listing is stat()ed
+        directly, since the filesystem may match names case-insensitively.
+        """
+        by_dir: Dict[str, List[Tuple[str, str]]] = {}
+        for rel in rel_paths:
+            parent, _, name = rel.rpartition('/')
+            by_dir.setdefault(parent, []).append((rel, name))
+
+        snapshot: Dict[str, Optional[os.stat_result]] = {}
+        for parent, files in by_dir.items():
+            try:
+                with os.scandir(root / parent) as it:
+                    entries = {entry.name: entry for entry in it}
+            except OSError:
+                entries = None
+            for rel, name in files:
+                entry = entries.get(name) if entries else None
+                try:
+                    if entry is not None:
+                        snapshot[rel] = entry.stat()
+                    elif entries is None:
+                        snapshot[rel] = None
+                    else:
+                        snapshot[rel] = (root / rel).stat()
+                except OSError:
+                    snapshot[rel] = None
+        return snapshot
+
+    @staticmethod
+    def _fast_copy(src_path: Path, dst_path: Path):
+        """Copy a file like shutil.copy2, in-kernel with os.copy_file_range where available.
+
+        copy_file_range moves the data without a userspace buffer (and lets
+        the filesystem share extents). If it is unsupported for these files
+        (older kernels, cross-filesystem, ENOSYS), shutil.copy2 is used,
+        which itself copies with sendfile on Linux.
+        """
+        if not hasattr(os, 'copy_file_range'):
+            shutil.copy2(src_path, dst_path)
+            return
+
+        src_fd = os.open(src_path, os.O_RDONLY | os.O_CLOEXEC)
+        try:
+            dst_fd = os.open(dst_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC, 0o666)
+            try:
+                copied = 0
+                while True:
+                    try:
+                        n = os.copy_file_range(src_fd, dst_fd, 1 << 30)
+                    except OSError:
+                        if copied:
+                            raise
+                        break
+                    if n == 0:
+                        break
+                    copied += n
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+
+        if copied or os.path.getsize(src_path) == 0:
+            shutil.copystat(src_path, dst_path)
+        else:
+            shutil.copy2(src_path, dst_path)
+
+    @staticmethod
+    def _resolve_paths(base: Path, rels: Sequence[str]) -> List[Path]:
+        """Absolute paths of rels under base, resolved once per batch"""
+        return [base / rel for rel in rels]
+
     def sync_directory_batch(self, sync_mappings: List[Tuple[str, str]], 
                            source_base: Path, target_base: Path, 
-                           description: str = "Sync") -> Dict[str, Any]:
-        """Sync multiple files based on mapping list"""
-        
-        print(f"🔄 {description}")
-        print(f"Source: {source_base}")
-        print(f"Target: {target_base}")
-        print()
+                           description: str = "Sync", log: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Sync multiple files based on mapping list.
+
+        Files are synced concurrently (each copy mostly waits on the
+        filesystem); their output is collected and written in mapping order.
+        If log is given, all output is appended to it instead of printed.
+        """
+        lines = [] if log is None else log
+        lines.append(f"🔄 {description}")
+        lines.append(f"Source: {source_base}")
+        lines.append(f"Target: {target_base}")
+        lines.append("")
         
         results = {
             "total_files": len(sync_mappings),
@@ -194,9 +581,16 @@ class MT5SyncEngine:
             "file_results": []
         }
         
-        for src_rel, dst_rel in sync_mappings:
-            src_path = source_base / src_rel
-            dst_path = target_base / dst_rel
+        src_rels = [src_rel for src_rel, _ in sync_mappings]
+        src_paths = self._resolve_paths(source_base, src_rels)
+        dst_paths = self._resolve_paths(target_base, [dst_rel for _, dst_rel in sync_mappings])
+        # Each target directory is created once per batch, not once per file
+        created_dirs: set = set()
+        
+        def sync_mapping(i: int) -> Tuple[Dict[str, Any], List[str]]:
+            src_rel = src_rels[i]
+            src_path = src_paths[i]
+            dst_path = dst_paths[i]
             
             if not src_path.exists():
                 error_result = {
@@ -205,13 +599,18 @@ class MT5SyncEngine:
                     "action": "error",
                     "error": "Source file not found"
                 }
-                results["file_results"].append(error_result)
-                results["errors"] += 1
-                print(f"  ❌ Not found: {src_rel}")
-                continue
+                return error_result, [f"  ❌ Not found: {src_rel}"]
             
-            sync_result = self.sync_file(src_path, dst_path)
+            file_lines: List[str] = []
+            sync_result = self.sync_file(src_path, dst_path, log=file_lines, created_dirs=created_dirs)
             sync_result["file"] = src_rel
+            return sync_result, file_lines
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(self.MAX_FILE_WORKERS, len(sync_mappings)))) as executor:
+            mapped = list(executor.map(sync_mapping, range(len(sync_mappings))))
+        
+        for sync_result, file_lines in mapped:
+            lines.extend(file_lines)
             results["file_results"].append(sync_result)
             
             if sync_result["success"]:
@@ -223,17 +622,22 @@ class MT5SyncEngine:
                 results["errors"] += 1
         
         # Print summary
-        print(f"\n📊 {description} Summary:")
-        print(f"   Total files: {results['total_files']}")
-        print(f"   ✅ Synced: {results['synced']}")
-        print(f"   ✓ Unchanged: {results['unchanged']}")
-        print(f"   ❌ Errors: {results['errors']}")
+        lines.append(f"\n📊 {description} Summary:")
+        lines.append(f"   Total files: {results['total_files']}")
+        lines.append(f"   ✅ Synced: {results['synced']}")
+        lines.append(f"   ✓ Unchanged: {results['unchanged']}")
+        lines.append(f"   ❌ Errors: {results['errors']}")
+        if log is None:
+            print("\n".join(lines))
         
         return results
 
 
 class ProjectQuantumSyncManager:
     """Main sync manager for ProjectQuantum files"""
+
+    # Files hashed at the same time by verify_sync_integrity
+    HASH_WORKERS = 8
     
     def __init__(self):
         self.dev_dir = Path("/mnt/c/DevCenter/MT5-Unified/MQL5-Development")
@@ -252,6 +656,9 @@ class ProjectQuantumSyncManager:
         
         # Initialize sync engine
         self.sync_engine = MT5SyncEngine(self.dev_dir, self.mt5_terminals)
+
+        # Hashes of unchanged files are reused across runs
+        FileHashManager.cache.open(HashCache.DEFAULT_PATH)
         
         # Define sync mappings
         self.core_files = [
@@ -296,6 +703,14 @@ class ProjectQuantumSyncManager:
             ("Scripts/ProjectQuantum/Test_ArrayUtils.mq5", "Scripts/ProjectQuantum/Test_ArrayUtils.mq5"),
             ("Scripts/ProjectQuantum/Test_Defensive.mq5", "Scripts/ProjectQuantum/Test_Defensive.mq5"),
         ]
+        
+        # Source and destination sides of core_files as parallel tuples
+        self.core_src, self.core_dst = (tuple(side) for side in zip(*self.core_files))
+        # core_files for reverse sync; the same list while every file keeps its path
+        if self.core_src == self.core_dst:
+            self._reverse_core_files = self.core_files
+        else:
+            self._reverse_core_files = list(zip(self.core_dst, self.core_src))
     
     def verify_terminal_access(self) -> Dict[str, Any]:
         """Verify access to MT5 terminals"""
@@ -345,21 +760,27 @@ class ProjectQuantumSyncManager:
             print("❌ No accessible terminals found")
             return {"error": "No accessible terminals"}
         
-        # Sync to each terminal
-        all_results = {}
-        
-        for i, terminal in enumerate(target_terminals, 1):
-            print(f"\n📁 Syncing to Terminal {i}: {terminal.name}")
-            print("-" * 50)
-            
+        # Sync to each terminal - concurrently, since each is an
+        # independent destination; output is printed in terminal order
+        def sync_terminal(i: int, terminal: Path) -> Tuple[Dict[str, Any], List[str]]:
+            log = [f"\n📁 Syncing to Terminal {i}: {terminal.name}", "-" * 50]
             terminal_results = self.sync_engine.sync_directory_batch(
                 self.core_files,
                 self.dev_dir,
                 terminal,
-                f"Dev → Terminal {i}"
+                f"Dev → Terminal {i}",
+                log=log
             )
-            
+            return terminal_results, log
+        
+        all_results = {}
+        
+        with ThreadPoolExecutor(max_workers=len(target_terminals)) as executor:
+            synced = list(executor.map(sync_terminal, range(1, len(target_terminals) + 1), target_terminals))
+        
+        for i, (terminal_results, log) in enumerate(synced, 1):
             all_results[f"terminal_{i}"] = terminal_results
+        print("\n".join(line for _, log in synced for line in log))
         
         # Generate overall summary
         total_terminals = len(target_terminals)
@@ -400,7 +821,7 @@ class ProjectQuantumSyncManager:
                     reverse_mappings.append((pattern, pattern))
         else:
             # Use core files in reverse
-            reverse_mappings = [(dst, src) for src, dst in self.core_files]
+            reverse_mappings = self._reverse_core_files
         
         print(f"Source: {self.primary_terminal}")
         print(f"Target: {self.dev_dir}")
@@ -441,52 +862,91 @@ class ProjectQuantumSyncManager:
         
         print(f"Checking integrity across {len(accessible_terminals)} terminals...")
         
-        # Check each core file
-        for src_rel, _ in self.core_files:
-            verification["files_checked"] += 1
-            
+        # First compare every copy with its dev file by stat(), noting the
+        # copies (and dev files) that still have to be hashed
+        # (each directory is listed once rather than stat()ing every path)
+        rel_paths = self.core_src
+        dev_snapshot = MT5SyncEngine.snapshot_files(self.dev_dir, rel_paths)
+        terminal_snapshots = [MT5SyncEngine.snapshot_files(t, rel_paths) for t in accessible_terminals]
+        checks = []
+        to_hash: Dict[Path, None] = {}
+        for src_rel in rel_paths:
             # Get file from development directory as reference
             dev_file = self.dev_dir / src_rel
-            if not dev_file.exists():
+            if dev_snapshot[src_rel] is None:
+                checks.append((src_rel, dev_file, None))
+                continue
+            
+            dev_signature = FileHashManager.signature_of(dev_snapshot[src_rel])
+            # Copies with the same size and mtime_ns are taken as identical
+            # (as with the dev file), so only one copy per signature is hashed
+            representatives: Dict[Tuple[int, int], Path] = {}
+            terminal_checks = []
+            for terminal, snapshot in zip(accessible_terminals, terminal_snapshots):
+                terminal_file = terminal / src_rel
+                if snapshot[src_rel] is None:
+                    terminal_checks.append((terminal, terminal_file, False, False))
+                    continue
+
+                terminal_signature = FileHashManager.signature_of(snapshot[src_rel])
+                match = FileHashManager.signatures_match(dev_signature, terminal_signature)
+                if match is None:
+                    if terminal_signature is not None:
+                        terminal_file = representatives.setdefault(terminal_signature, terminal_file)
+                    to_hash[dev_file] = None
+                    to_hash[terminal_file] = None
+                # terminal_file is the copy whose hash stands for this terminal's
+                terminal_checks.append((terminal, terminal_file, True, match))
+            checks.append((src_rel, dev_file, terminal_checks))
+        
+        # Then hash what stat() could not decide, several files at a time
+        # (hashing and reading release the GIL)
+        with ThreadPoolExecutor(max_workers=max(1, min(self.HASH_WORKERS, len(to_hash)))) as executor:
+            hashes = dict(zip(to_hash, executor.map(FileHashManager.fast_hash, to_hash)))
+        
+        # Check each core file; the report is printed in one write at the end
+        lines = []
+        for src_rel, dev_file, terminal_checks in checks:
+            verification["files_checked"] += 1
+            
+            if terminal_checks is None:
                 verification["missing_files"] += 1
                 verification["integrity_issues"].append(f"Missing in dev: {src_rel}")
                 continue
             
-            dev_hash = FileHashManager.compute_hash(dev_file)
-            
             # Check against all terminals
-            terminal_hashes = {}
-            for terminal in accessible_terminals:
-                terminal_file = terminal / src_rel
-                if terminal_file.exists():
-                    terminal_hashes[str(terminal)] = FileHashManager.compute_hash(terminal_file)
-                else:
-                    terminal_hashes[str(terminal)] = None
+            all_match = True
+            for terminal, terminal_file, exists, match in terminal_checks:
+                if not exists:
+                    all_match = False
                     verification["missing_files"] += 1
                     verification["integrity_issues"].append(f"Missing in {terminal.name}: {src_rel}")
+                    continue
+                if match is None:
+                    terminal_hash = hashes[terminal_file]
+                    match = terminal_hash is not None and terminal_hash == hashes[dev_file]
+                all_match = all_match and match
             
-            # Check if all hashes match dev hash
-            all_match = all(h == dev_hash for h in terminal_hashes.values() if h is not None)
-            
-            if all_match and all(h is not None for h in terminal_hashes.values()):
+            if all_match:
                 verification["files_in_sync"] += 1
-                print(f"   ✅ {src_rel}")
+                lines.append(f"   ✅ {src_rel}")
             else:
                 verification["files_out_of_sync"] += 1
                 verification["integrity_issues"].append(f"Hash mismatch: {src_rel}")
-                print(f"   ❌ {src_rel} (hash mismatch)")
+                lines.append(f"   ❌ {src_rel} (hash mismatch)")
         
         # Print summary
-        print(f"\n📊 Integrity Verification Summary:")
-        print(f"   Files checked: {verification['files_checked']}")
-        print(f"   ✅ In sync: {verification['files_in_sync']}")
-        print(f"   ❌ Out of sync: {verification['files_out_of_sync']}")
-        print(f"   📂 Missing: {verification['missing_files']}")
+        lines.append(f"\n📊 Integrity Verification Summary:")
+        lines.append(f"   Files checked: {verification['files_checked']}")
+        lines.append(f"   ✅ In sync: {verification['files_in_sync']}")
+        lines.append(f"   ❌ Out of sync: {verification['files_out_of_sync']}")
+        lines.append(f"   📂 Missing: {verification['missing_files']}")
         
         integrity_percentage = (verification['files_in_sync'] / verification['files_checked']) * 100 if verification['files_checked'] > 0 else 0
         verification["integrity_percentage"] = integrity_percentage
         
-        print(f"   🎯 Integrity: {integrity_percentage:.1f}%")
+        lines.append(f"   🎯 Integrity: {integrity_percentage:.1f}%")
+        print("\n".join(lines))
         
         return verification
     
@@ -510,54 +970,29 @@ class ProjectQuantumSyncManager:
             return {"error": f"Not a git repository: {self.project_root}"}
 
         try:
-            # Get current branch
-            branch_result = subprocess.run(
-                ['git', 'branch', '--show-current'],
-                capture_output=True, text=True, cwd=self.project_root,
-                timeout=30  # Add timeout to prevent hanging
-            )
-            if branch_result.returncode != 0:
-                error_msg = branch_result.stderr.strip() or "Unknown git error"
-                print(f"   ❌ Error getting current branch: {error_msg}")
-                return {"error": f"Git branch command failed: {error_msg}"}
-
-            current_branch = branch_result.stdout.strip()
-
-            # Get git status
+            # Branch, upstream ahead/behind counts and file status in one git call.
+            # --no-optional-locks keeps this read-only check from taking index.lock
+            # and rewriting the index, so it never contends with a running git command.
             status_result = subprocess.run(
-                ['git', 'status', '--porcelain'],
+                ['git', '--no-optional-locks', 'status', '-z', '--porcelain=v2', '--branch'],
                 capture_output=True, text=True, cwd=self.project_root,
-                timeout=30
+                timeout=30  # Add timeout to prevent hanging
             )
             if status_result.returncode != 0:
                 error_msg = status_result.stderr.strip() or "Unknown git error"
-                print(f"   ⚠️  Warning: Could not get git status: {error_msg}")
-                git_status = ""
-            else:
-                git_status = status_result.stdout.strip()
+                print(f"   ❌ Error getting git status: {error_msg}")
+                return {"error": f"Git status command failed: {error_msg}"}
 
-            # Check for unpushed commits (may fail if no upstream is set)
-            try:
-                unpushed_result = subprocess.run(
-                    ['git', 'log', '@{u}..HEAD', '--oneline'],
-                    capture_output=True, text=True, cwd=self.project_root,
-                    timeout=30
-                )
-                if unpushed_result.returncode == 0:
-                    unpushed_commits = unpushed_result.stdout.strip()
-                else:
-                    # No upstream set, or other error - not a fatal condition
-                    unpushed_commits = ""
-            except subprocess.TimeoutExpired:
-                print(f"   ⚠️  Warning: Timeout checking unpushed commits")
-                unpushed_commits = ""
+            current_branch, ahead, uncommitted_files = self._parse_git_status(status_result.stdout)
+            # Only listed when status reports commits ahead of the upstream
+            unpushed_commits = self._list_unpushed_commits() if ahead else []
 
             branch_status = {
                 "current_branch": current_branch,
-                "has_uncommitted_changes": bool(git_status),
-                "uncommitted_files": git_status.split('\n') if git_status else [],
-                "has_unpushed_commits": bool(unpushed_commits),
-                "unpushed_commits": unpushed_commits.split('\n') if unpushed_commits else [],
+                "has_uncommitted_changes": bool(uncommitted_files),
+                "uncommitted_files": uncommitted_files,
+                "has_unpushed_commits": ahead > 0,
+                "unpushed_commits": unpushed_commits,
                 "sync_recommended": False
             }
 
@@ -582,6 +1017,59 @@ class ProjectQuantumSyncManager:
             print(f"   ❌ Error checking git status: {e}")
             return {"error": str(e)}
     
+    def _list_unpushed_commits(self) -> List[str]:
+        """Return "<sha> <subject>" for each commit on HEAD not yet on its upstream"""
+        try:
+            unpushed_result = subprocess.run(
+                ['git', 'log', '@{u}..HEAD', '--oneline'],
+                capture_output=True, text=True, cwd=self.project_root,
+                timeout=30
+            )
+        except subprocess.TimeoutExpired:
+            print("   ⚠️  Warning: Timeout checking unpushed commits")
+            return []
+        if unpushed_result.returncode != 0:
+            # Upstream gone since the status call, or other error - not fatal
+            return []
+        unpushed_commits = unpushed_result.stdout.strip()
+        return unpushed_commits.split('\n') if unpushed_commits else []
+
+    @staticmethod
+    def _parse_git_status(output: str) -> Tuple[str, int, List[str]]:
+        """Parse `git status -z --porcelain=v2 --branch` output.
+
+        Returns:
+            (current branch, commits ahead of upstream, changed files as
+            short-format "XY path" lines). The branch is empty when HEAD is
+            detached and the ahead count is 0 when no upstream is set.
+        """
+        current_branch = ""
+        ahead = 0
+        files = []
+        records = iter(output.split('\0'))
+        for record in records:
+            if not record:
+                continue
+            if record.startswith('# '):
+                key, _, value = record[2:].partition(' ')
+                if key == 'branch.head' and value != '(detached)':
+                    current_branch = value
+                elif key == 'branch.ab':
+                    ahead = int(value.split()[0])
+            elif record[0] in '?!':
+                files.append(record[0] * 2 + record[1:])
+            elif record[0] == '1':
+                fields = record.split(' ', 8)
+                files.append(f"{fields[1].replace('.', ' ')} {fields[8]}")
+            elif record[0] == '2':
+                # Renames and copies are followed by the original path as its own record
+                fields = record.split(' ', 9)
+                files.append(f"{fields[1].replace('.', ' ')} {next(records, '')} -> {fields[9]}")
+            elif record[0] == 'u':
+                fields = record.split(' ', 10)
+                files.append(f"{fields[1]} {fields[10]}")
+        return current_branch, ahead, files
+
     def generate_sync_manifest(self) -> Path:
         """Generate comprehensive sync manifest"""
         manifest = {
@@ -597,10 +1085,15 @@ class ProjectQuantumSyncManager:
             }
         }
         
+        if orjson is not None:
+            data = orjson.dumps(manifest, option=orjson.OPT_INDENT_2, default=str)
+        else:
+            data = json.dumps(manifest, indent=2, default=str).encode('utf-8')
+        
         manifest_path = self.project_root / "sync_manifest.json"
         try:
-            with open(manifest_path, 'w') as f:
-                json.dump(manifest, f, indent=2)
+            with open(manifest_path, 'wb') as f:
+                f.write(data)
             print(f"📄 Sync manifest saved: {manifest_path}")
         except PermissionError:
             print(f"❌ Cannot save manifest (permission denied): {manifest_path}")
@@ -12,18 +12,25 @@ Usage:
 """
 
 import json
+import operator
 import re
 import subprocess
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, Iterator, List, Set
 
 PROJECT_ROOT = Path(__file__).parent.parent
 CLAUDE_MD = PROJECT_ROOT / "CLAUDE.md"
 COPILOT_MD = PROJECT_ROOT / ".github" / "copilot-instructions.md"
 FINDINGS_CACHE = PROJECT_ROOT / "Tools" / ".audit_findings_cache.json"
 
+# Rule code tag in an auditor output line, e.g. "[NUM001]" (matched on the raw bytes)
+_RULE_LINE_RE = re.compile(rb'\[([A-Z]+\d+)\]')
+# Rule code mentioned anywhere in an instruction file (matched on the raw bytes)
+_RULE_CODE_RE = re.compile(rb'[A-Z]{2,}0\d{2}')
+
 # Map audit rule codes to instruction patterns
 RULE_TO_INSTRUCTION = {
     "NUM001": {
@@ -65,19 +72,47 @@ RULE_TO_INSTRUCTION = {
 }
 
 
+def stream_output(args: List[str], timeout: float = 120) -> Iterator[bytes]:
+    """Run a command and yield its stdout lines (bytes) as it writes them.
+
+    The command is killed after timeout seconds, and subprocess.TimeoutExpired
+    is raised once its remaining output has been read.
+    """
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        proc.kill()
+
+    proc = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=1 << 20)
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        with proc:
+            yield from proc.stdout
+    finally:
+        timer.cancel()
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(args, timeout)
+
+
 def run_audit() -> Dict:
     """Run the financial auditor and capture findings."""
     print("Running financial audit...")
     try:
-        result = subprocess.run(
+        # Try to parse JSON from output (json.loads takes the bytes as they are);
+        # the rest of the output is still read so the auditor runs to completion
+        json_line = None
+        for line in stream_output(
             ["python3", str(PROJECT_ROOT / "Tools" / "mql5_financial_auditor.py"),
-             "--project", str(PROJECT_ROOT), "--json"],
-            capture_output=True, text=True, timeout=120
-        )
-        # Try to parse JSON from output
-        for line in result.stdout.split('\n'):
-            if line.strip().startswith('{'):
-                return json.loads(line)
+             "--project", str(PROJECT_ROOT), "--json"]
+        ):
+            if json_line is None:
+                stripped = line.lstrip()
+                if stripped[:1] == b'{':
+                    json_line = stripped
+        if json_line is not None:
+            return json.loads(json_line)
     except (subprocess.TimeoutExpired, json.JSONDecodeError, FileNotFoundError) as e:
         print(f"Audit failed: {e}")
     return {}
@@ -85,20 +120,18 @@ def run_audit() -> Dict:
 
 def extract_findings_from_output() -> List[Dict]:
     """Run audit and extract findings."""
-    result = subprocess.run(
-        ["python3", str(PROJECT_ROOT / "Tools" / "mql5_financial_auditor.py"),
-         "--project", str(PROJECT_ROOT)],
-        capture_output=True, text=True, timeout=120
-    )
-
     findings = []
-    # Parse the text output for rule codes
-    for line in result.stdout.split('\n'):
-        match = re.search(r'\[([A-Z]+\d+)\]', line)
+    # Parse the output for rule codes as the auditor writes it; only
+    # matching lines are decoded
+    for line in stream_output(
+        ["python3", str(PROJECT_ROOT / "Tools" / "mql5_financial_auditor.py"),
+         "--project", str(PROJECT_ROOT)]
+    ):
+        match = _RULE_LINE_RE.search(line)
         if match:
             findings.append({
-                "rule": match.group(1),
-                "line": line.strip()
+                "rule": match.group(1).decode('ascii'),
+                "line": line.strip().decode('utf-8', errors='replace')
             })
     return findings
 
@@ -117,9 +150,9 @@ def get_current_rules(filepath: Path) -> Set[str]:
     if not filepath.exists():
         return set()
 
-    content = filepath.read_text()
-    # Find all rule codes mentioned
-    return set(re.findall(r'[A-Z]{2,}0\d{2}', content))
+    content = filepath.read_bytes()
+    # Find all rule codes mentioned; codes are ASCII, so only the matches are decoded
+    return {code.decode('ascii') for code in set(_RULE_CODE_RE.findall(content))}
 
 
 def suggest_updates(finding_counts: Dict[str, int]) -> List[Dict]:
@@ -128,21 +161,22 @@ def suggest_updates(finding_counts: Dict[str, int]) -> List[Dict]:
 
     claude_rules = get_current_rules(CLAUDE_MD)
 
-    for rule_code, count in sorted(finding_counts.items(), key=lambda x: -x[1]):
-        if rule_code in RULE_TO_INSTRUCTION:
-            info = RULE_TO_INSTRUCTION[rule_code]
-            # Check if rule is already well-documented
-            is_new = rule_code not in claude_rules
-
-            suggestions.append({
-                "rule": rule_code,
-                "count": count,
-                "is_new": is_new,
-                "title": info["title"],
-                "instruction": info["rule"],
-                "bad_example": info["bad"],
-                "good_example": info["good"]
-            })
+    for rule_code, count in sorted(finding_counts.items(), key=operator.itemgetter(1), reverse=True):
+        info = RULE_TO_INSTRUCTION.get(rule_code)
+        if info is None:
+            continue
+        # Check if rule is already well-documented
+        is_new = rule_code not in claude_rules
+
+        suggestions.append({
+            "rule": rule_code,
+            "count": count,
+            "is_new": is_new,
+            "title": info["title"],
+            "instruction": info["rule"],
+            "bad_example": info["bad"],
+            "good_example": info["good"]
+        })
 
     return suggestions
 
@@ -177,20 +211,23 @@ def append_to_claude_md(suggestions: List[Dict]) -> int:
         return 0
 
     # Add new rules section
-    additions = "\n## Recently Added Rules\n"
-    additions += f"*Added: {datetime.now().strftime('%Y-%m-%d')} from audit findings*\n"
-
-    for s in new_rules:
-        additions += format_instruction_block(s)
-
-    # Insert before the last section or at end
-    if "---" in content:
-        parts = content.rsplit("---", 1)
-        new_content = parts[0] + additions + "\n---" + parts[1]
-    else:
-        new_content = content + additions
-
-    CLAUDE_MD.write_text(new_content)
+    parts = ["\n## Recently Added Rules\n",
+             f"*Added: {datetime.now().strftime('%Y-%m-%d')} from audit findings*\n"]
+    parts.extend(format_instruction_block(s) for s in new_rules)
+    additions = "".join(parts)
+
+    # Insert before the last section or at end, writing the pieces
+    # straight out rather than concatenating a copy of the whole file
+    idx = content.rfind("---")
+    with open(CLAUDE_MD, 'w') as f:
+        if idx >= 0:
+            f.write(content[:idx])
+            f.write(additions)
+            f.write("\n---")
+            f.write(content[idx + 3:])
+        else:
+            f.write(content)
+            f.write(additions)
     return len(new_rules)
 
 
@@ -228,9 +265,9 @@ def main():
         print("No cached findings. Run with --from-audit to analyze.")
         findings = extract_findings_from_output()
 
-    # Cache findings
+    # Cache findings (compact: only this tool reads the cache)
     FINDINGS_CACHE.parent.mkdir(exist_ok=True)
-    FINDINGS_CACHE.write_text(json.dumps(findings, indent=2))
+    FINDINGS_CACHE.write_text(json.dumps(findings, separators=(',', ':')))
 
     counts = analyze_findings(findings)
     suggestions = suggest_updates(counts)
@@ -10,13 +10,36 @@ import hashlib
 import json
 import subprocess
 import re
+import argparse
 from datetime import datetime
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Patterns used by update_file_version, once per MQL5 file. Files are
+# edited as bytes and keep their own line endings.
+_VERSION_RE = re.compile(rb'#property version\s+"[\d\.]+"')
+_BUILD_RE = re.compile(rb'// Build:[^\r\n]*')
+_VERSION_LINE_RE = re.compile(rb'(#property version[^\n]*?(\r?\n))')
+
+# A "**/*.ext" pattern, matched by suffix during a single tree walk
+_SUFFIX_PATTERN_RE = re.compile(r'\*\*/\*(\.[^*?\[\]/]+)')
+
+# Read size for hashing where hashlib.file_digest is unavailable
+HASH_BLOCK_SIZE = 1024 * 1024
 
 class VersionManager:
     def __init__(self):
         self.base_version = "1"
         self.build_number = self.get_build_number()
+        # Fixed for the run, so formatted once rather than per file
+        self.full_version = self.get_full_version()
+        started = datetime.now()
+        self.now_iso = started.isoformat()
+        self.now_str = started.strftime('%Y-%m-%d %H:%M:%S')
+        # Lines written by update_file_version, the same for every file
+        self._version_line = f'#property version   "{self.full_version}"'.encode()
+        self._build_prefix = f"// Build: {self.build_number} | ".encode()
+        self._build_info = self._build_prefix + f"Generated: {self.now_str}".encode()
         self.project_root = Path(__file__).parent
         self.signature_file = self.project_root / "file_signatures.json"
         
@@ -41,64 +64,76 @@ class VersionManager:
     
     def calculate_file_hash(self, filepath):
         """Calculate SHA256 hash of a file"""
-        sha256_hash = hashlib.sha256()
         try:
             with open(filepath, "rb") as f:
-                for byte_block in iter(lambda: f.read(4096), b""):
+                if hasattr(hashlib, 'file_digest'):
+                    # Python 3.11+: read and hashed in C, without the GIL
+                    return hashlib.file_digest(f, 'sha256').hexdigest()
+                sha256_hash = hashlib.sha256()
+                for byte_block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
                     sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+                return sha256_hash.hexdigest()
         except:
             return None
     
-    def sign_file(self, filepath):
-        """Create signature for a file"""
+    def sign_file(self, filepath, stat=None):
+        """Create signature for a file, from its stat() result if already known"""
         file_hash = self.calculate_file_hash(filepath)
         if not file_hash:
             return None
             
-        stat = os.stat(filepath)
+        if stat is None:
+            stat = os.stat(filepath)
         signature = {
             'path': str(filepath),
             'hash': file_hash,
             'size': stat.st_size,
             'modified': datetime.fromtimestamp(stat.st_mtime).isoformat(),
-            'version': self.get_full_version(),
-            'signed_at': datetime.now().isoformat()
+            'version': self.full_version,
+            'signed_at': self.now_iso
         }
         return signature
     
     def update_file_version(self, filepath):
         """Update version information in MQL5 file"""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+            filepath = Path(filepath)
+            content = filepath.read_bytes()
+            original = content
+            
+            # Already stamped with this version and build (only the Generated
+            # time would change): leave the file alone
+            version_line = self._version_line
+            if (version_line in content and self._build_prefix in content
+                    and content.count(b'#property version') == 1 and content.count(b'// Build:') == 1):
+                return True
             
             # Update version property
-            content = re.sub(
-                r'#property version\s+"[\d\.]+"',
-                f'#property version   "{self.get_full_version()}"',
+            content = _VERSION_RE.sub(
+                version_line,
                 content
             )
             
             # Update build info comment if exists
-            build_info = f"// Build: {self.build_number} | Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
+            build_info = self._build_info
             
-            if "// Build:" in content:
-                content = re.sub(
-                    r'// Build:.*',
+            if b"// Build:" in content:
+                content = _BUILD_RE.sub(
                     build_info,
                     content
                 )
             else:
                 # Add build info after version
-                content = re.sub(
-                    r'(#property version[^\n]*\n)',
-                    f'\\1{build_info}\n',
+                content = _VERSION_LINE_RE.sub(
+                    rb'\1' + build_info + rb'\2',
                     content
                 )
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Nothing to change (e.g. no version line): keep the file and its mtime
+            if content == original:
+                return True
+            
+            filepath.write_bytes(content)
                 
             return True
         except Exception as e:
@@ -112,35 +147,89 @@ class VersionManager:
         
         signatures = {}
         
-        for pattern in patterns:
-            files = self.project_root.glob(pattern)
-            for filepath in files:
-                if filepath.is_file():
-                    signature = self.sign_file(filepath)
-                    if signature:
-                        rel_path = filepath.relative_to(self.project_root)
-                        signatures[str(rel_path)] = signature
+        files = self.find_files(patterns)
+        filepaths = [filepath for filepath, _ in files]
+        stats = [stat for _, stat in files]
+        
+        # Hash several files at a time (hashlib releases the GIL)
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for filepath, signature in zip(filepaths, executor.map(self.sign_file, filepaths, stats)):
+                if signature:
+                    rel_path = filepath.relative_to(self.project_root)
+                    signatures[str(rel_path)] = signature
         
         return signatures
     
+    def find_files(self, patterns):
+        """(path, stat result) of the regular files under project_root matching
+        patterns, grouped in pattern order.
+
+        When every pattern is of the form "**/*.ext" the tree is walked
+        once with os.scandir, names are matched by suffix and each file's
+        stat() comes from its directory entry; otherwise each pattern is
+        globbed separately and the stat results are None.
+        """
+        matches = [_SUFFIX_PATTERN_RE.fullmatch(pattern) for pattern in patterns]
+        if not all(matches):
+            return [(filepath, None) for pattern in patterns for filepath in self.project_root.glob(pattern)
+                    if filepath.is_file()]
+        
+        # normcase: suffixes match case-insensitively where the filesystem does (Windows)
+        groups = {os.path.normcase(match.group(1)): [] for match in matches}
+        self._scan_tree(self.project_root, tuple(groups), groups)
+        return [file for group in groups.values() for file in group]
+    
+    def _scan_tree(self, directory, suffixes, groups):
+        """Add the matching files under directory to groups, in os.walk order"""
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                        continue
+                    name_case = os.path.normcase(entry.name)
+                    if not name_case.endswith(suffixes):
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+                    for suffix in suffixes:
+                        if name_case.endswith(suffix):
+                            groups[suffix].append((Path(entry.path), stat))
+                            break
+        except OSError:
+            return  # Unreadable directory: skipped, as os.walk does
+        for subdir in subdirs:
+            self._scan_tree(subdir, suffixes, groups)
+    
     def save_signatures(self, signatures):
         """Save signatures to file"""
         signature_data = {
             'project': 'Project Quantum',
-            'version': self.get_full_version(),
+            'version': self.full_version,
             'generated': datetime.now().isoformat(),
             'total_files': len(signatures),
             'signatures': signatures
         }
         
+        # Compact separators: the file is only read back by verify_signatures
         with open(self.signature_file, 'w') as f:
-            json.dump(signature_data, f, indent=2)
+            json.dump(signature_data, f, separators=(',', ':'))
         
         print(f"📄 Signatures saved: {len(signatures)} files")
         return True
     
-    def verify_signatures(self):
-        """Verify all file signatures"""
+    def verify_signatures(self, quick=False):
+        """Verify all file signatures.
+
+        Every file is hashed. With quick set, files whose size and
+        modification time still match their signature are taken as
+        verified without being hashed; an edit that keeps both is missed.
+        """
         if not self.signature_file.exists():
             print("❌ No signature file found")
             return False
@@ -153,15 +242,28 @@ class VersionManager:
         failed = 0
         modified_files = []
         
-        for rel_path, stored_sig in signatures.items():
+        def current_hash_of(rel_path, stored_sig):
+            """Hash of the file now on disk, or False if it is missing"""
             filepath = self.project_root / rel_path
-            
-            if not filepath.exists():
+            try:
+                stat = filepath.stat()
+            except OSError:
+                return False
+            if (quick and stat.st_size == stored_sig.get('size')
+                    and datetime.fromtimestamp(stat.st_mtime).isoformat() == stored_sig.get('modified')):
+                return stored_sig['hash']
+            return self.calculate_file_hash(filepath)
+        
+        # Hash concurrently, then report in signature order
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            current_hashes = list(executor.map(current_hash_of, signatures, signatures.values()))
+        
+        for (rel_path, stored_sig), current_hash in zip(signatures.items(), current_hashes):
+            if current_hash is False:
                 print(f"❌ Missing: {rel_path}")
                 failed += 1
                 continue
             
-            current_hash = self.calculate_file_hash(filepath)
             if current_hash != stored_sig['hash']:
                 print(f"⚠️  Modified: {rel_path}")
                 modified_files.append(rel_path)
@@ -180,24 +282,29 @@ class VersionManager:
 
 def main():
     """Main version and signature management"""
+    parser = argparse.ArgumentParser(description="Project Quantum version and signature manager")
+    parser.add_argument("--quick", action="store_true",
+                        help="Verify files whose size and mtime match their signature without hashing them")
+    args = parser.parse_args()
+
     vm = VersionManager()
     
     print(f"🏷️  Project Quantum Version Manager")
     print("=" * 40)
-    print(f"Version: {vm.get_full_version()}")
+    print(f"Version: {vm.full_version}")
     print(f"Build: {vm.build_number}")
     print()
     
     # Update versions in all MQL5 files
     print("🔄 Updating version information...")
-    mql_files = list(vm.project_root.glob("**/*.mq5")) + list(vm.project_root.glob("**/*.mqh"))
+    mql_files = vm.find_files(["**/*.mq5", "**/*.mqh"])
     
     updated = 0
-    for filepath in mql_files:
+    for filepath, _ in mql_files:
         if vm.update_file_version(filepath):
             updated += 1
     
-    print(f"✅ Updated {updated} files with version {vm.get_full_version()}")
+    print(f"✅ Updated {updated} files with version {vm.full_version}")
     print()
     
     # Generate and save signatures
@@ -208,7 +315,7 @@ def main():
     
     # Verify signatures
     print("🔍 Verifying signatures...")
-    if vm.verify_signatures():
+    if vm.verify_signatures(quick=args.quick):
         print("✅ All signatures verified")
     else:
         print("⚠️  Some files have signature mismatches")